@@ -1,17 +1,24 @@
 from __future__ import annotations
 
 import itertools
-from typing import List, Dict, Any, cast
+import logging
+import os
+from typing import TYPE_CHECKING, List, Dict, Any, FrozenSet, Optional
 
-from BaseClasses import Region, Location, Item, Tutorial, ItemClassification
+from BaseClasses import Region, Location, Item, Tutorial, ItemClassification, CollectionState
 from worlds.AutoWorld import World, WebWorld
 from . import items
 from . import locations
 from . import creatures
 from . import plants
 from . import options
-from .items import item_table, base_item_table, non_vehicle_depth_table, seamoth_table, prawn_table, cyclops_table, group_items, items_by_type, ItemType
-from .rules import set_rules
+from .items import item_table, group_items, items_by_type, ItemType
+
+if TYPE_CHECKING:
+    # only needed to generate, so they are imported where used and tooling importing the world skips them
+    from .rules import DepthCache, LocationRuleCompiler, LogicProfile, SharedLogic
+    from .profiling import RuleProfiler
+    from .pool import PoolEntry
 
 
 class SubnauticaWeb(WebWorld):
@@ -25,7 +32,7 @@ class SubnauticaWeb(WebWorld):
     )]
 
 
-all_locations = {data["name"]: loc_id for loc_id, data in locations.location_table.items()}
+all_locations = {data.name: loc_id for loc_id, data in locations.location_table.items()}
 all_locations.update(creatures.creature_locations)
 all_locations.update(plants.plant_locations)
 
@@ -47,6 +54,14 @@ class SubnauticaWorld(World):
     origin_region_name = "Planet 4546B"
     creatures_to_scan: List[str]
     plants_to_scan: List[str]
+    shared_logic: SharedLogic
+    logic_profile: LogicProfile
+    rule_compiler: LocationRuleCompiler
+    rule_profiler: Optional[RuleProfiler] = None
+    # Set in generate_early. Item link group worlds never run it, so collect and remove leave their depth alone.
+    depth_cache: Optional[DepthCache] = None
+    # items that change the max depth, see rules.depth_requirements
+    depth_item_names: FrozenSet[str] = frozenset()
 
     def generate_early(self) -> None:
         if not self.options.filler_items_distribution.weights_pair[1][-1]:
@@ -54,6 +69,16 @@ class SubnauticaWorld(World):
         if self.options.early_seaglide:
             self.multiworld.local_early_items[self.player]["Seaglide Fragment"] = 2
 
+        from .rules import get_shared_logic, DepthCache, depth_item_names
+        self.shared_logic = get_shared_logic(self.multiworld, self.options)
+        self.logic_profile = self.shared_logic.profile
+        self.depth_cache = DepthCache(self.player, self.options, self.shared_logic)
+        self.depth_item_names = depth_item_names
+        self.rule_profiler = None
+        if os.environ.get("SUBNAUTICA_RULE_PROFILE"):
+            from .profiling import RuleProfiler
+            self.rule_profiler = RuleProfiler()
+
         scan_option: options.AggressiveScanLogic = self.options.creature_scan_logic
         creature_pool = scan_option.get_pool()
         plant_pool = self.options.plant_scans.get_pool()
@@ -74,18 +99,52 @@ class SubnauticaWorld(World):
         self.plants_to_scan = self.random.sample(
             plant_pool, self.options.plant_scans.value)
 
+    def count_sphere_one(self) -> int:
+        """Free locations of this world reachable with just its starting items."""
+        from .rules import get_reachable_location_ids, get_sphere_one_location_ids
+        if any(item.advancement for item in self.multiworld.precollected_items[self.player]):
+            reachable = get_reachable_location_ids(self, CollectionState(self.multiworld))
+        else:
+            # without starting items the requirements alone tell, no rules need to run
+            reachable = get_sphere_one_location_ids(self.shared_logic, self.options, self.plants_to_scan)
+        return sum(1 for location in self.multiworld.get_locations(self.player)
+                   if location.address in reachable and location.item is None)
+
+    def check_sphere_one(self) -> None:
+        """Fill places the local early items, like the Early Seaglide fragments, in this world's sphere one
+        before anything else. Those that don't fit are placed normally, so warn about that here."""
+        sphere_one = self.count_sphere_one()
+        early_items = sum(self.multiworld.local_early_items[self.player].values())
+        if self.multiworld.players == 1:
+            # without other worlds, early items have to go here as well
+            early_items += sum(self.multiworld.early_items[self.player].values())
+        if sphere_one >= early_items:
+            return
+        message = (f"Subnautica player {self.player_name} has {sphere_one} free location(s) reachable with "
+                   f"their starting items, but {early_items} early item(s) to place there.")
+        if self.options.early_seaglide:
+            message += (" Early Seaglide may not be honored; place fewer items early, raise Swim Rule or "
+                        "Pre-Seaglide Distance, or start with more items.")
+        logging.warning(f"{message} The rest will be placed anywhere.")
+
     def create_regions(self):
         # Create Region
         planet_region = Region("Planet 4546B", self.player, self.multiworld)
+        logic_regions = None
+        if self.options.logic_regions:
+            # only needed for this option, so tooling importing the world doesn't load it
+            from .regions import LogicRegions
+            logic_regions = LogicRegions(self, planet_region)
 
         # Create regular locations
-        location_names = itertools.chain((location["name"] for location in locations.location_table.values()),
+        location_names = itertools.chain((location.name for location in locations.location_table.values()),
                                          (creature + creatures.suffix for creature in self.creatures_to_scan),
                                          (plant for plant in self.plants_to_scan))
         for location_name in location_names:
             loc_id = self.location_name_to_id[location_name]
-            location = SubnauticaLocation(self.player, location_name, loc_id, planet_region)
-            planet_region.locations.append(location)
+            region = logic_regions.get_location_region(loc_id) if logic_regions else planet_region
+            location = SubnauticaLocation(self.player, location_name, loc_id, region)
+            region.locations.append(location)
 
         # Create events
         goal_event_name = self.options.goal.get_event_name()
@@ -102,95 +161,52 @@ class SubnauticaWorld(World):
         # Register region to multiworld
         self.multiworld.regions.append(planet_region)
 
-    # refer to rules.py
-    set_rules = set_rules
-
-    def get_theoretical_swim_depth(self):
-        depth: int = 600
-        consider_items: bool = False
-        seaglide_depth: int = self.options.seaglide_depth.value
-        if self.options.swim_rule.value > 999:
-            depth = int(self.options.swim_rule.value / 10)
-            consider_items = True
-        else:
-            depth = self.options.swim_rule.value
-            consider_items = self.options.consider_items.value
-
-        if consider_items:
-            return depth + seaglide_depth + 150
-        return depth
+    def set_rules(self) -> None:
+        # refer to rules.py
+        from .rules import set_rules
+        set_rules(self)
 
     def create_items(self):
+        from .pool import grouped_item_count, base_pool_entries, non_vehicle_depth_pool_entries, seamoth_pool_entries, \
+            prawn_pool_entries, cyclops_pool_entries, non_vehicle_depth_item_names
+
         # Generate item pool
         pool: List[SubnauticaItem] = []
-        extras = self.options.creature_scans.value + self.options.plant_scans.value
-
-        grouped = set(itertools.chain.from_iterable(group_items.values()))
-
-        for item_id, item in base_item_table.items():
-            if item_id in grouped:
-                extras += item.count
-            else:
-                for _ in range(item.count):
-                    subnautica_item = self.create_item(item.name)
-                    if item.name == "Neptune Launch Platform":
-                        if self.options.goal.get_event_name() == "Neptune Launch":
-                            self.get_location("Aurora - Captain Data Terminal").place_locked_item(subnautica_item)
-                        else:
-                            pool.append(subnautica_item)
-                    elif item.name == "Cyclops Shield Generator":
-                        if self.options.include_cyclops.value == 2 and self.options.goal.get_event_name() != "Neptune Launch":
-                            extras += 1
-                        else:
-                            pool.append(subnautica_item)
-                    else:
-                        pool.append(subnautica_item)
-
-        for item_id, item in seamoth_table.items():
-            if self.options.include_seamoth.value < 2:
-                for _ in range(item.count):
-                    pool.append(self.create_item(item.name))
-            else:
-                extras += item.count
-
-        for item_id, item in prawn_table.items():
-            if self.options.include_prawn.value < 2:
-                for _ in range(item.count):
-                    pool.append(self.create_item(item.name))
+        extras = self.options.creature_scans.value + self.options.plant_scans.value + grouped_item_count
+        neptune_goal: bool = self.options.goal.get_event_name() == "Neptune Launch"
+
+        for entry in base_pool_entries:
+            if entry.name == "Neptune Launch Platform" and neptune_goal:
+                self.get_location("Aurora - Captain Data Terminal").place_locked_item(
+                    self.create_pool_items(entry)[0])
+            elif entry.name == "Cyclops Shield Generator" and self.options.include_cyclops.value == 2 \
+                    and not neptune_goal:
+                extras += entry.count
             else:
-                extras += item.count
-
-        for item_id, item in cyclops_table.items():
-            if self.options.include_cyclops.value < 2:
-                for _ in range(item.count):
-                    pool.append(self.create_item(item.name))
+                pool += self.create_pool_items(entry)
+
+        for include_option, entries in ((self.options.include_seamoth, seamoth_pool_entries),
+                                        (self.options.include_prawn, prawn_pool_entries),
+                                        (self.options.include_cyclops, cyclops_pool_entries)):
+            if include_option.value < 2:
+                for entry in entries:
+                    pool += self.create_pool_items(entry)
             else:
-                extras += item.count
+                extras += sum(entry.count for entry in entries)
 
         # If we can't make the necessary depth by traditional (vehicle) means, use the alternates
         # Shift the items to progression as part of that change
-        seamoth_can_make_it: bool = False
-        if self.options.include_seamoth.value == 0 and self.get_theoretical_swim_depth() + 900 > 1443:
-            seamoth_can_make_it = True
-
-        advanced_logic: bool = False
-        if seamoth_can_make_it is False and self.options.include_prawn.value > 0 and \
-                self.options.include_cyclops.value > 0:
-            advanced_logic = True
-
-        for item_id, item in non_vehicle_depth_table.items():
-            for _ in range(item.count):
-                if advanced_logic:
-                    pool.append(self.create_shifted_item(item.name, ItemClassification.progression))
-                else:
-                    pool.append(self.create_item(item.name))
+        advanced_logic: bool = self.logic_profile.advanced_logic
+        depth_classification = ItemClassification.progression if advanced_logic else None
+
+        for entry in non_vehicle_depth_pool_entries:
+            pool += self.create_pool_items(entry, depth_classification)
 
         group_amount: int = 2
         assert len(group_items) * group_amount <= extras
         for item_id in group_items:
             name = item_table[item_id].name
-            for _ in range(group_amount):
-                pool.append(self.create_item(name))
+            pool += [self.create_item(name) for _ in range(group_amount)]
             extras -= group_amount
 
         # list of high-count important fragments as priority filler
@@ -205,7 +221,7 @@ class SubnauticaWorld(World):
         if self.options.include_seamoth.value < 2 or \
                 self.options.include_prawn.value < 2 or \
                 self.options.include_cyclops.value < 2 or \
-                self.options.goal.get_event_name() == "Neptune Launch":
+                neptune_goal:
             num += 2
             priority_filler.append("Mobile Vehicle Bay Fragment")
             priority_filler.append("Moonpool Fragment")
@@ -232,24 +248,38 @@ class SubnauticaWorld(World):
             num += 4
 
         for item_name in self.random.sample(priority_filler, k=min(extras, num)):
-            item = self.create_item(item_name)
-
             # Make sure if we make any non-vehicle items here that show up do so as progression
-            for alt_item in non_vehicle_depth_table.values():
-                if item_name == alt_item.name and advanced_logic:
-                    item = self.create_shifted_item(item_name, ItemClassification.progression)
-
-            pool.append(item)
+            if advanced_logic and item_name in non_vehicle_depth_item_names:
+                pool.append(self.create_shifted_item(item_name, ItemClassification.progression))
+            else:
+                pool.append(self.create_item(item_name))
             extras -= 1
 
         # resource bundle filler
-        for _ in range(extras):
-            item = self.create_filler()
-            item = cast(SubnauticaItem, item)
-            pool.append(item)
+        pool += self.create_filler_items(extras)
 
         self.multiworld.itempool += pool
 
+    def generate_basic(self) -> None:
+        # starting items are only pushed after generate_early
+        self.check_sphere_one()
+
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        changed = super().collect(state, item)
+        if changed and item.name in self.depth_item_names and self.depth_cache:
+            self.depth_cache.update(state)
+        return changed
+
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        changed = super().remove(state, item)
+        if changed and item.name in self.depth_item_names and self.depth_cache:
+            self.depth_cache.update(state)
+        return changed
+
+    def generate_output(self, output_directory: str) -> None:
+        if self.rule_profiler:
+            self.rule_profiler.log_report(self.player_name)
+
     def fill_slot_data(self) -> Dict[str, Any]:
         vanilla_tech: List[str] = []
 
@@ -314,9 +344,26 @@ class SubnauticaWorld(World):
         item_id: int = self.item_name_to_id[name]
         return SubnauticaItem(name, cls, item_id, player=self.player)
 
+    def create_pool_items(self, entry: PoolEntry,
+                          classification: Optional[ItemClassification] = None) -> List[SubnauticaItem]:
+        """All copies of a pool entry, optionally shifted to another classification."""
+        if classification is None:
+            classification = entry.classification
+        name, item_id, player = entry.name, entry.item_id, self.player
+        return [SubnauticaItem(name, classification, item_id, player) for _ in range(entry.count)]
+
     def get_filler_item_name(self) -> str:
+        return self.get_filler_item_names(1)[0]
+
+    def get_filler_item_names(self, count: int) -> List[str]:
+        """Draws count filler names in one go.
+        Consumes the same randomness as count separate get_filler_item_name calls, so results match those."""
         item_names, cum_item_weights = self.options.filler_items_distribution.weights_pair
-        return self.random.choices(item_names, cum_weights=cum_item_weights, k=1)[0]
+        return self.random.choices(item_names, cum_weights=cum_item_weights, k=count)
+
+    def create_filler_items(self, count: int) -> List[SubnauticaItem]:
+        """Bulk version of create_filler."""
+        return [self.create_item(name) for name in self.get_filler_item_names(count)]
 
 
 class SubnauticaLocation(Location):
@@ -0,0 +1,111 @@
+"""Compact binary alternative to the JSON exports, written by exports.py when run with --binary.
+
+All numbers are little endian. The file is a header followed by five sections in this order:
+    header:      magic b"SNAP", format version (u16), location count (u32)
+    locations:   per location: id (u32), x, y, z (f32)
+    logic:       laser cutter bitset, then propulsion cannon bitset; bit i (LSB first) is location record i
+    items:       count (u32), per item: id (u32), tech type length (u16), tech type (utf-8)
+    groups:      count (u32), per group: id (u32), member count (u32), member ids (u32 each)
+    item types:  count (u32), per type: type (u8), item count (u32), item ids (u32 each)
+read_export is the reference reader."""
+
+import struct
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Set, Tuple
+
+magic: bytes = b"SNAP"
+format_version: int = 1
+
+header_record = struct.Struct("<4sHI")
+location_record = struct.Struct("<I3f")
+count_record = struct.Struct("<I")
+item_record = struct.Struct("<IH")
+group_record = struct.Struct("<II")
+item_type_record = struct.Struct("<BI")
+
+
+class BinaryExport(NamedTuple):
+    locations: Dict[int, Tuple[float, float, float]]
+    laser_cutter: List[int]
+    propulsion_cannon: List[int]
+    items: Dict[int, str]
+    groups: Dict[int, List[int]]
+    item_types: Dict[int, List[int]]
+
+
+def get_bitset(location_ids: List[int], gated: Set[int]) -> bytes:
+    bits = 0
+    for index, location_id in enumerate(location_ids):
+        if location_id in gated:
+            bits |= 1 << index
+    return bits.to_bytes((len(location_ids) + 7) // 8, "little")
+
+
+def get_ids(count: int) -> struct.Struct:
+    return struct.Struct(f"<{count}I")
+
+
+def write_export(locations: Mapping[int, Tuple[float, float, float]], laser_cutter: Iterable[int],
+                 propulsion_cannon: Iterable[int], items: Mapping[int, str], groups: Mapping[int, Iterable[int]],
+                 item_types: Mapping[int, Iterable[int]]) -> Iterator[bytes]:
+    """Yields the file section by section, so it can be hashed and written without being held at once."""
+    location_ids = list(locations)
+    yield header_record.pack(magic, format_version, len(location_ids))
+    yield b"".join(location_record.pack(location_id, *locations[location_id]) for location_id in location_ids)
+
+    yield get_bitset(location_ids, set(laser_cutter))
+    yield get_bitset(location_ids, set(propulsion_cannon))
+
+    yield count_record.pack(len(items))
+    for item_id, tech_type in items.items():
+        encoded = tech_type.encode()
+        yield item_record.pack(item_id, len(encoded)) + encoded
+
+    for section, record in ((groups, group_record), (item_types, item_type_record)):
+        yield count_record.pack(len(section))
+        for key, ids in section.items():
+            ids = list(ids)
+            yield record.pack(key, len(ids)) + get_ids(len(ids)).pack(*ids)
+
+
+def read_export(data: bytes) -> BinaryExport:
+    file_magic, version, location_count = header_record.unpack_from(data)
+    if file_magic != magic or version != format_version:
+        raise ValueError(f"Not a version {format_version} Subnautica binary export.")
+    offset = header_record.size
+
+    locations: Dict[int, Tuple[float, float, float]] = {}
+    for location_id, x, y, z in location_record.iter_unpack(
+            data[offset:offset + location_count * location_record.size]):
+        locations[location_id] = (x, y, z)
+    offset += location_count * location_record.size
+
+    location_ids = list(locations)
+    bitset_size = (location_count + 7) // 8
+    gated: List[List[int]] = []
+    for _ in range(2):
+        bits = int.from_bytes(data[offset:offset + bitset_size], "little")
+        gated.append([location_id for index, location_id in enumerate(location_ids) if bits >> index & 1])
+        offset += bitset_size
+
+    items: Dict[int, str] = {}
+    item_count, = count_record.unpack_from(data, offset)
+    offset += count_record.size
+    for _ in range(item_count):
+        item_id, length = item_record.unpack_from(data, offset)
+        offset += item_record.size
+        items[item_id] = data[offset:offset + length].decode()
+        offset += length
+
+    sections: List[Dict[int, List[int]]] = []
+    for record in (group_record, item_type_record):
+        section: Dict[int, List[int]] = {}
+        section_count, = count_record.unpack_from(data, offset)
+        offset += count_record.size
+        for _ in range(section_count):
+            key, id_count = record.unpack_from(data, offset)
+            offset += record.size
+            section[key] = list(get_ids(id_count).unpack_from(data, offset))
+            offset += id_count * count_record.size
+        sections.append(section)
+
+    return BinaryExport(locations, gated[0], gated[1], items, sections[0], sections[1])
@@ -1,56 +1,139 @@
 """Runnable module that exports data needed by the mod/client."""
 
-if __name__ == "__main__":
-    import json
-    import math
-    import sys
-    import os
+import hashlib
+import json
+import os
+from typing import Callable, Dict, Iterable, List, Tuple, Union
 
-    # makes this module runnable from its world folder.
-    sys.path.remove(os.path.dirname(__file__))
-    new_home = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
-    os.chdir(new_home)
-    sys.path.append(new_home)
+manifest_name: str = "manifest.json"
+binary_name: str = "subnautica.bin"
 
-    from worlds.subnautica.locations import Vector, location_table
+
+def write_exports(export_folder: str, world_version: str, binary: bool) -> Tuple[List[str], List[str]]:
+    """Write all exports to export_folder. Returns the names of the files written and of those removed."""
+    from worlds.subnautica.locations import location_table, get_location_flag_table, LocationFlag
     from worlds.subnautica.items import item_table, group_items, items_by_type
+    from worlds.subnautica.binary_export import write_export
     from NetUtils import encode
 
-    export_folder = os.path.join(new_home, "Subnautica Export")
     os.makedirs(export_folder, exist_ok=True)
 
     def in_export_folder(path: str) -> str:
         return os.path.join(export_folder, path)
 
-    payload = {location_id: location_data["position"] for location_id, location_data in location_table.items()}
-    with open(in_export_folder("locations.json"), "w") as f:
-        json.dump(payload, f)
+    # The manifest lists the hash of every export, so the mod can skip reloading unchanged files,
+    # and lets repeated runs skip rewriting them. Exports edited by hand aren't noticed;
+    # delete the manifest to write everything again.
+    try:
+        with open(in_export_folder(manifest_name)) as f:
+            previous_hashes: Dict[str, str] = json.load(f)["files"]
+    except (OSError, ValueError, KeyError):
+        previous_hashes = {}
+
+    file_hashes: Dict[str, str] = {}
+    written: List[str] = []
+
+    def export(file_name: str, chunks: Callable[[], Iterable[Union[str, bytes]]]) -> None:
+        """Hash the file's chunks, and only if that differs from the last export stream them to disk."""
+        content_hash = hashlib.sha256()
+        for chunk in chunks():
+            content_hash.update(chunk.encode() if isinstance(chunk, str) else chunk)
+        file_hashes[file_name] = content_hash.hexdigest()
+        path = in_export_folder(file_name)
+        if previous_hashes.get(file_name) == file_hashes[file_name] and os.path.exists(path):
+            return
+        with open(path + ".tmp", "wb") as f:
+            for chunk in chunks():
+                f.write(chunk.encode() if isinstance(chunk, str) else chunk)
+        os.replace(path + ".tmp", path)
+        written.append(file_name)
+
+    encoder = json.JSONEncoder()
 
+    locations_payload = {location_id: location_data.position for location_id, location_data in location_table.items()}
+    export("locations.json", lambda: encoder.iterencode(locations_payload))
 
-    payload = {
+    def needs_tool(flags: int, tool: int, slip: int) -> bool:
+        return bool(flags & tool) and not flags & slip
+
+    logic_payload = {
         # "LaserCutter" in Subnautica ID
-        "761": [location_id for location_id, location_data
-                in location_table.items() if location_data["need_laser_cutter"] and location_data.get("can_slip_through", 'none') not in ['laser', 'both']],
+        "761": [location_id for location_id, flags in get_location_flag_table().items()
+                if needs_tool(flags, LocationFlag.laser_cutter, LocationFlag.slip_laser_cutter)],
         # PropulsionCannon in Subnautica ID
-        "757": [location_id for location_id, location_data in location_table.items()
-            if location_data.get("need_propulsion_cannon", False) and location_data.get("can_slip_through", 'none') not in ['propulsion', 'both']],
+        "757": [location_id for location_id, flags in get_location_flag_table().items()
+                if needs_tool(flags, LocationFlag.propulsion_cannon, LocationFlag.slip_propulsion_cannon)],
     }
-    with open(in_export_folder("logic.json"), "w") as f:
-        json.dump(payload, f)
+    export("logic.json", lambda: encoder.iterencode(logic_payload))
 
     itemcount = sum(item_data.count for item_data in item_table.values())
     assert itemcount == len(location_table), f"{itemcount} != {len(location_table)}"
-    payload = {item_id: item_data.tech_type for item_id, item_data in item_table.items()}
-    import json
+    items_payload = {item_id: item_data.tech_type for item_id, item_data in item_table.items()}
+    export("items.json", lambda: encoder.iterencode(items_payload))
+
+    # encode to convert set to list
+    export("group_items.json", lambda: (encode(group_items),))
+
+    export("item_types.json", lambda: encoder.iterencode(items_by_type))
 
-    with open(in_export_folder("items.json"), "w") as f:
-        json.dump(payload, f)
+    if binary:
+        export(binary_name, lambda: write_export(
+            {location_id: (data.x, data.y, data.z) for location_id, data in location_table.items()},
+            logic_payload["761"],
+            logic_payload["757"],
+            items_payload,
+            group_items,
+            items_by_type,
+        ))
 
-    with open(in_export_folder("group_items.json"), "w") as f:
-        # encode to convert set to list
-        f.write(encode(group_items))
+    # Exports of an earlier run that this one didn't produce, such as subnautica.bin without --binary,
+    # would otherwise linger next to a manifest that doesn't list them.
+    removed: List[str] = []
+    for file_name in sorted((set(previous_hashes) | {binary_name}) - set(file_hashes)):
+        path = in_export_folder(file_name)
+        if os.path.isfile(path):
+            os.remove(path)
+            removed.append(file_name)
+
+    manifest = {
+        "world_version": world_version,
+        "files": file_hashes,
+    }
+    manifest_text = json.dumps(manifest, indent=4, sort_keys=True)
+    try:
+        with open(in_export_folder(manifest_name)) as f:
+            manifest_changed = f.read() != manifest_text
+    except OSError:
+        manifest_changed = True
+    if manifest_changed:
+        with open(in_export_folder(manifest_name), "w") as f:
+            f.write(manifest_text)
+        written.append(manifest_name)
+
+    return written, removed
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--binary", action="store_true",
+                        help="also write subnautica.bin, the compact format described in binary_export.py")
+    cli_args = parser.parse_args()
+
+    # makes this module runnable from its world folder.
+    world_folder = os.path.dirname(os.path.abspath(__file__))
+    sys.path.remove(os.path.dirname(__file__))
+    new_home = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+    os.chdir(new_home)
+    sys.path.append(new_home)
 
-    with open(in_export_folder("item_types.json"), "w") as f:
-        json.dump(items_by_type, f)
+    with open(os.path.join(world_folder, "archipelago.json")) as f:
+        version: str = json.load(f)["world_version"]
 
-    print(f"Subnautica exports dumped to {in_export_folder('')}")
+    export_path = os.path.join(new_home, "Subnautica Export")
+    changed, deleted = write_exports(export_path, version, cli_args.binary)
+    removed_note = f", removed: {', '.join(deleted)}" if deleted else ""
+    print(f"Subnautica exports dumped to {os.path.join(export_path, '')}, "
+          f"{len(changed)} file(s) changed: {', '.join(changed) or 'none'}{removed_note}")
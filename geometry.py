@@ -0,0 +1,119 @@
+import bisect
+import functools
+import itertools
+import math
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from .locations import location_table
+from .plants import all_flora
+
+
+class LocationGeometry(NamedTuple):
+    radiated: bool
+    center_distance: float
+    depth: float
+
+
+aurora_center: Tuple[float, float, float] = (1038.0, 0.0, -163.1)
+radiation_radius: float = 950
+
+
+def is_radiated(x: float, y: float, z: float) -> bool:
+    aurora_dist = math.sqrt((x - aurora_center[0]) ** 2 + (y - aurora_center[1]) ** 2 + (z - aurora_center[2]) ** 2)
+    return aurora_dist < radiation_radius
+
+
+def get_geometry(x: float, y: float, z: float) -> LocationGeometry:
+    return LocationGeometry(
+        is_radiated(x, y, z),
+        math.sqrt(x ** 2 + z ** 2),
+        -y,  # y-up
+    )
+
+
+# Positions never change, so work out the floats once instead of on every rule call.
+# Location and flora ids don't overlap, so both live in the same table.
+# Built on first use, so importing the world for tooling doesn't pay for it.
+@functools.cache
+def get_geometry_table() -> Dict[int, LocationGeometry]:
+    return {
+        loc_id: get_geometry(data.x, data.y, data.z)
+        for loc_id, data in itertools.chain(location_table.items(), all_flora.items())
+    }
+
+
+class SpatialIndex:
+    """Location and flora ids by position, for the geometric questions logic and tools ask.
+
+    A uniform grid over the horizontal plane answers radius and ring queries around any point by only
+    looking at the cells the query touches. Ids sorted by depth and by distance from the map center
+    answer depth bands and center rings with a binary search. All distances are in meters, y is up."""
+    cell_size: float
+    positions: Dict[int, Tuple[float, float, float]]
+    cells: Dict[Tuple[int, int], List[int]]
+    depth_order: List[int]
+    depths: List[float]
+    center_distance_order: List[int]
+    center_distances: List[float]
+
+    def __init__(self, positions: Dict[int, Tuple[float, float, float]], cell_size: float = 250):
+        self.cell_size = cell_size
+        self.positions = positions
+        self.cells = {}
+        for loc_id, (x, y, z) in positions.items():
+            self.cells.setdefault(self.get_cell(x, z), []).append(loc_id)
+
+        def sorted_by(key: Dict[int, float]) -> Tuple[List[int], List[float]]:
+            order = sorted(key, key=key.__getitem__)
+            return order, [key[loc_id] for loc_id in order]
+
+        self.depth_order, self.depths = sorted_by({loc_id: -y for loc_id, (x, y, z) in positions.items()})
+        self.center_distance_order, self.center_distances = sorted_by(
+            {loc_id: math.sqrt(x ** 2 + z ** 2) for loc_id, (x, y, z) in positions.items()})
+
+    def get_cell(self, x: float, z: float) -> Tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(z / self.cell_size)
+
+    def get_candidates(self, x: float, z: float, reach: float) -> Iterable[int]:
+        """Ids in every cell that overlaps the square of half width reach around (x, z)."""
+        if math.isinf(reach):
+            return self.positions
+        min_x, min_z = self.get_cell(x - reach, z - reach)
+        max_x, max_z = self.get_cell(x + reach, z + reach)
+        if (max_x - min_x + 1) * (max_z - min_z + 1) > len(self.cells):
+            # the square covers more cells than are populated
+            return self.positions
+        return itertools.chain.from_iterable(self.cells.get((cell_x, cell_z), ())
+                                             for cell_x in range(min_x, max_x + 1)
+                                             for cell_z in range(min_z, max_z + 1))
+
+    def query_radius(self, x: float, y: float, z: float, radius: float) -> List[int]:
+        """Ids closer than radius to (x, y, z)."""
+        radius_squared = radius ** 2
+        positions = self.positions
+        return [loc_id for loc_id in self.get_candidates(x, z, radius)
+                if (positions[loc_id][0] - x) ** 2 + (positions[loc_id][1] - y) ** 2
+                + (positions[loc_id][2] - z) ** 2 < radius_squared]
+
+    def query_ring(self, x: float, z: float, inner: float, outer: float) -> List[int]:
+        """Ids whose horizontal distance to (x, z) is above inner and at most outer."""
+        if x == 0 and z == 0:
+            return self.query_center_distance(inner, outer)
+        positions = self.positions
+        return [loc_id for loc_id in self.get_candidates(x, z, outer)
+                if inner < math.sqrt((positions[loc_id][0] - x) ** 2 + (positions[loc_id][2] - z) ** 2) <= outer]
+
+    def query_center_distance(self, inner: float, outer: float) -> List[int]:
+        """Ids whose horizontal distance to the map center is above inner and at most outer."""
+        return self.center_distance_order[bisect.bisect_right(self.center_distances, inner):
+                                          bisect.bisect_right(self.center_distances, outer)]
+
+    def query_depth_band(self, low: float, high: float) -> List[int]:
+        """Ids deeper than low and at most high."""
+        return self.depth_order[bisect.bisect_right(self.depths, low):bisect.bisect_right(self.depths, high)]
+
+
+@functools.cache
+def get_spatial_index() -> SpatialIndex:
+    return SpatialIndex({loc_id: (data.x, data.y, data.z)
+                         for loc_id, data in itertools.chain(location_table.items(), all_flora.items())})
@@ -1,4 +1,5 @@
-from typing import Dict, TypedDict, List
+import functools
+from typing import Dict, NamedTuple, TypedDict, List
 
 
 class Vector(TypedDict):
@@ -7,12 +8,47 @@ class Vector(TypedDict):
     z: float
 
 
-class LocationDict(TypedDict, total=False):
+class LocationRecord(NamedTuple):
     name: str
-    can_slip_through: str
-    need_laser_cutter: bool
-    position: Vector
-    need_propulsion_cannon: bool
+    x: float
+    y: float
+    z: float
+    need_laser_cutter: bool = False
+    need_propulsion_cannon: bool = False
+    can_slip_through: str = "none"
+
+    @property
+    def position(self) -> Vector:
+        return {"x": self.x, "y": self.y, "z": self.z}
+
+
+class LocationFlag:
+    """Bits of a location's get_location_flag_table entry. Plain ints, as an IntFlag is slow to create on import
+    and the rules would only unwrap it again."""
+    none = 0
+    laser_cutter = 1
+    propulsion_cannon = 2
+    # the tool segment can be slipped through instead, see options.CanSlipThrough
+    slip_laser_cutter = 4
+    slip_propulsion_cannon = 8
+
+
+tool_flags: int = LocationFlag.laser_cutter | LocationFlag.propulsion_cannon
+# shifting the slip flags by this lines them up with the tool they bypass
+slip_flag_shift: int = 2
+
+
+def get_location_flags(loc: LocationRecord) -> int:
+    flags = LocationFlag.none
+    if loc.need_laser_cutter:
+        flags |= LocationFlag.laser_cutter
+    if loc.need_propulsion_cannon:
+        flags |= LocationFlag.propulsion_cannon
+    if loc.can_slip_through in ("laser", "both"):
+        flags |= LocationFlag.slip_laser_cutter
+    if loc.can_slip_through in ("propulsion", "both"):
+        flags |= LocationFlag.slip_propulsion_cannon
+    return flags
 
 
 events: List[str] = [
@@ -22,136 +58,142 @@ events: List[str] = [
     "Repair Aurora Drive",
 ]
 
-location_table: Dict[int, LocationDict] = {
-    33000: {'name': 'Blood Kelp Trench Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': -1234.3, 'y': -349.7, 'z': -396.0}},
-    33001: {'name': 'Blood Kelp Trench Wreck - Inside Databox', 'need_laser_cutter': False, 'position': {'x': -1208.0, 'y': -349.6, 'z': -383.0}},
-    33002: {'name': 'Blood Kelp Trench Wreck - PDA', 'need_laser_cutter': False, 'position': {'x': -1210.6, 'y': -340.7, 'z': -393.4}},
-    33003: {'name': 'Bulb Zone West Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': 903.8, 'y': -220.3, 'z': 590.9}},
-    33004: {'name': 'Bulb Zone West Wreck - Under Databox', 'need_laser_cutter': False, 'position': {'x': 910.9, 'y': -201.8, 'z': 623.5}},
-    33005: {'name': 'Bulb Zone West Wreck - Inside Databox', 'need_laser_cutter': True, 'position': {'x': 914.9, 'y': -202.1, 'z': 611.8}},
-    33006: {'name': 'Bulb Zone West Wreck - PDA', 'need_laser_cutter': True, 'position': {'x': 912.6, 'y': -202.0, 'z': 609.5}},
-    33007: {'name': 'Bulb Zone East Wreck - Databox', 'need_laser_cutter': False, 'position': {'x': 1327.1, 'y': -234.9, 'z': 575.8}},
-    33008: {'name': 'Dunes North Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': -1407.7, 'y': -344.2, 'z': 721.5}},
-    33009: {'name': 'Dunes North Wreck - Office Databox', 'need_laser_cutter': False, 'position': {'x': -1393.9, 'y': -329.7, 'z': 733.5}},
-    33010: {'name': 'Dunes North Wreck - PDA', 'need_laser_cutter': False, 'position': {'x': -1396.3, 'y': -330.8, 'z': 730.0}},
-    33011: {'name': 'Dunes North Wreck - Cargo Databox', 'need_laser_cutter': True, 'position': {'x': -1409.8, 'y': -332.4, 'z': 706.9}},
-    33012: {'name': 'Dunes West Wreck - Databox', 'need_laser_cutter': False, 'position': {'x': -1626.2, 'y': -357.5, 'z': 99.5}},
-    33013: {'name': 'Dunes East Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': -1196.3, 'y': -223.0, 'z': 12.5}},
-    33014: {'name': 'Dunes East Wreck - Inside Databox', 'need_laser_cutter': False, 'position': {'x': -1206.4, 'y': -225.6, 'z': 4.0}},
-    33015: {'name': 'Grand Reef North Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': -269.7, 'y': -262.8, 'z': -764.3}},
-    33016: {'name': 'Grand Reef North Wreck - Elevator Databox', 'need_laser_cutter': True, 'position': {'x': -285.8, 'y': -240.2, 'z': -786.5}},
-    33017: {'name': 'Grand Reef North Wreck - Bottom Databox', 'need_laser_cutter': False, 'position': {'x': -285.2, 'y': -262.4, 'z': -788.4}},
-    33018: {'name': 'Grand Reef North Wreck - Hangar PDA', 'need_laser_cutter': False, 'position': {'x': -272.5, 'y': -254.7, 'z': -788.5}},
-    33019: {'name': 'Grand Reef South Wreck - Trench Databox', 'need_laser_cutter': False, 'position': {'x': -850.9, 'y': -473.2, 'z': -1414.6}},
-    33020: {'name': 'Grand Reef South Wreck - Comms Databox', 'need_laser_cutter': True, 'position': {'x': -889.4, 'y': -433.8, 'z': -1424.8}},
-    33021: {'name': 'Grand Reef South Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': -862.4, 'y': -437.5, 'z': -1444.1}},
-    33022: {'name': 'Grand Reef South Wreck - PDA', 'need_laser_cutter': False, 'position': {'x': -887.9, 'y': -446.0, 'z': -1422.7}},
-    33023: {'name': 'Grassy Plateaus South Wreck - Databox', 'need_laser_cutter': False, 'position': {'x': -23.3, 'y': -105.8, 'z': -604.2}},
-    33024: {'name': 'Grassy Plateaus South Wreck - PDA', 'need_laser_cutter': False, 'position': {'x': -27.3, 'y': -106.8, 'z': -607.2}},
-    33025: {'can_slip_through': 'laser', 'name': 'Grassy Plateaus East Wreck - Breach Databox', 'need_laser_cutter': True, 'position': {'x': 313.9, 'y': -91.8, 'z': 432.6}},
-    33026: {'can_slip_through': 'laser', 'name': 'Grassy Plateaus East Wreck - Hangar Databox', 'need_laser_cutter': True, 'position': {'x': 319.4, 'y': -104.3, 'z': 441.5}},
-    33027: {'name': 'Grassy Plateaus West Wreck - Locker PDA', 'need_laser_cutter': False, 'position': {'x': -632.3, 'y': -75.0, 'z': -8.9}},
-    33028: {'name': 'Grassy Plateaus West Wreck - Data Terminal', 'need_laser_cutter': False, 'position': {'x': -664.4, 'y': -97.8, 'z': -8.0}},
-    33029: {'name': 'Grassy Plateaus Southwest Wreck - Databox', 'need_laser_cutter': True, 'position': {'x': -421.4, 'y': -107.8, 'z': -266.5}},
-    33030: {'name': 'Safe Shallows Wreck - PDA', 'need_laser_cutter': False, 'position': {'x': -44.0, 'y': -29.1, 'z': -403.6}},
-    33031: {'name': 'Kelp Forest Wreck - Databox', 'need_laser_cutter': False, 'position': {'x': -317.6, 'y': -78.8, 'z': 247.4}},
-    33032: {'name': 'Kelp Forest Wreck - PDA', 'need_laser_cutter': False, 'position': {'x': 63.2, 'y': -38.5, 'z': 382.9}},
-    33033: {'name': 'Mountains West Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': 740.3, 'y': -389.2, 'z': 1179.8}},
-    33034: {'name': 'Mountains West Wreck - Data Terminal', 'need_laser_cutter': True, 'position': {'x': 703.7, 'y': -365.9, 'z': 1199.3}},
-    33035: {'name': 'Mountains West Wreck - Hangar Databox', 'need_laser_cutter': True, 'position': {'x': 698.2, 'y': -350.8, 'z': 1186.9}},
-    33036: {'name': 'Mountains West Wreck - Office Databox', 'need_laser_cutter': False, 'position': {'x': 676.3, 'y': -343.6, 'z': 1204.6}},
-    33037: {'name': 'Mountains East Wreck - Comms Databox', 'need_laser_cutter': False, 'position': {'x': 1068.5, 'y': -283.4, 'z': 1345.3}},
-    33038: {'name': 'Mountains East Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': 1075.7, 'y': -288.9, 'z': 1321.8}},
-    33039: {'name': 'Northwestern Mushroom Forest Wreck - Cargo Databox', 'need_laser_cutter': True, 'position': {'x': -655.1, 'y': -109.6, 'z': 791.0}},
-    33040: {'name': 'Northwestern Mushroom Forest Wreck - Office Databox', 'need_laser_cutter': False, 'position': {'x': -663.4, 'y': -111.9, 'z': 777.9}},
-    33041: {'name': 'Northwestern Mushroom Forest Wreck - PDA', 'need_laser_cutter': False, 'position': {'x': -662.2, 'y': -113.4, 'z': 777.7}},
-    33042: {'name': "Sea Treader's Path Wreck - Outside Databox", 'need_laser_cutter': False, 'position': {'x': -1161.1, 'y': -191.7, 'z': -758.3}},
-    33043: {'name': "Sea Treader's Path Wreck - Hangar Databox", 'need_laser_cutter': True, 'position': {'x': -1129.5, 'y': -155.2, 'z': -729.3}},
-    33044: {'name': "Sea Treader's Path Wreck - Lobby Databox", 'need_laser_cutter': False, 'position': {'x': -1115.9, 'y': -175.3, 'z': -724.5}},
-    33045: {'name': "Sea Treader's Path Wreck - PDA", 'need_laser_cutter': False, 'position': {'x': -1136.8, 'y': -157.0, 'z': -734.6}},
-    33046: {'name': 'Sparse Reef Wreck - Locker Databox', 'need_laser_cutter': True, 'position': {'x': -789.8, 'y': -216.1, 'z': -711.0}},
-    33047: {'name': 'Sparse Reef Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': -810.7, 'y': -209.3, 'z': -685.5}},
-    33048: {'name': 'Sparse Reef Wreck - Lab Databox', 'need_laser_cutter': True, 'position': {'x': -795.5, 'y': -204.1, 'z': -774.7}},
-    33049: {'name': 'Underwater Islands Wreck - Outside Databox', 'need_laser_cutter': False, 'position': {'x': -170.8, 'y': -187.6, 'z': 880.7}},
-    33050: {'name': 'Underwater Islands Wreck - Hangar Databox', 'need_laser_cutter': True, 'position': {'x': -138.4, 'y': -193.6, 'z': 888.7}},
-    33051: {'name': 'Underwater Islands Wreck - Data Terminal', 'need_laser_cutter': True, 'position': {'x': -130.7, 'y': -193.2, 'z': 883.3}},
-    33052: {'name': 'Underwater Islands Wreck - Cable Databox', 'need_laser_cutter': False, 'position': {'x': -137.8, 'y': -193.4, 'z': 879.4}},
-    33053: {'name': 'Underwater Islands Wreck - Pipes Databox 1', 'need_laser_cutter': False, 'need_propulsion_cannon': True, 'position': {'x': -124.4, 'y': -200.7, 'z': 853.0}},
-    33054: {'name': 'Underwater Islands Wreck - Pipes Databox 2', 'need_laser_cutter': False, 'need_propulsion_cannon': True, 'position': {'x': -126.8, 'y': -201.1, 'z': 852.1}},
-    33055: {'name': 'Degasi Seabase - Deep Grand Reef - Bedroom Databox', 'need_laser_cutter': False, 'position': {'x': -643.8, 'y': -509.9, 'z': -941.9}},
-    33056: {'name': 'Degasi Seabase - Deep Grand Reef - Observatory Databox', 'need_laser_cutter': False, 'position': {'x': -635.1, 'y': -502.7, 'z': -951.4}},
-    33057: {'name': 'Degasi Seabase - Deep Grand Reef - Bedroom PDA', 'need_laser_cutter': False, 'position': {'x': -645.8, 'y': -508.7, 'z': -943.0}},
-    33058: {'name': 'Degasi Seabase - Deep Grand Reef - Outside PDA', 'need_laser_cutter': False, 'position': {'x': -630.5, 'y': -511.1, 'z': -936.1}},
-    33059: {'name': 'Degasi Seabase - Deep Grand Reef - Observatory PDA', 'need_laser_cutter': False, 'position': {'x': -647.7, 'y': -502.6, 'z': -935.8}},
-    33060: {'name': 'Degasi Seabase - Deep Grand Reef - Lab PDA', 'need_laser_cutter': False, 'position': {'x': -639.6, 'y': -505.9, 'z': -946.6}},
-    33061: {'name': 'Floating Island - Lake PDA', 'need_laser_cutter': False, 'position': {'x': -707.2, 'y': 0.5, 'z': -1096.7}},
-    33062: {'name': 'Degasi Seabase - Floating Island - Databox', 'need_laser_cutter': False, 'position': {'x': -765.7, 'y': 17.6, 'z': -1116.4}},
-    33063: {'name': 'Degasi Seabase - Floating Island - Room PDA', 'need_laser_cutter': False, 'position': {'x': -754.9, 'y': 14.6, 'z': -1108.9}},
-    33064: {'name': 'Degasi Seabase - Floating Island - Green Wall PDA', 'need_laser_cutter': False, 'position': {'x': -765.3, 'y': 14.1, 'z': -1115.0}},
-    33065: {'name': 'Degasi Seabase - Floating Island - Corridor PDA', 'need_laser_cutter': False, 'position': {'x': -758.6, 'y': 14.1, 'z': -1111.3}},
-    33066: {'name': 'Degasi Seabase - Floating Island - North Observatory PDA', 'need_laser_cutter': False, 'position': {'x': -805.4, 'y': 76.9, 'z': -1055.7}},
-    33067: {'name': 'Degasi Seabase - Floating Island - South Observatory PDA', 'need_laser_cutter': False, 'position': {'x': -715.9, 'y': 75.4, 'z': -1168.8}},
-    33068: {'name': 'Jellyshroom Cave - PDA', 'need_laser_cutter': False, 'position': {'x': -540.5, 'y': -250.8, 'z': -83.4}},
-    33069: {'name': 'Degasi Seabase - Jellyshroom Cave - Bedroom Databox', 'need_laser_cutter': False, 'position': {'x': 110.6, 'y': -264.9, 'z': -369.0}},
-    33070: {'name': 'Degasi Seabase - Jellyshroom Cave - Detached PDA', 'need_laser_cutter': False, 'position': {'x': 80.6, 'y': -268.6, 'z': -358.3}},
-    33071: {'name': 'Degasi Seabase - Jellyshroom Cave - Office PDA', 'need_laser_cutter': False, 'position': {'x': 78.2, 'y': -265.0, 'z': -373.4}},
-    33072: {'name': 'Degasi Seabase - Jellyshroom Cave - Locker PDA', 'need_laser_cutter': False, 'position': {'x': 85.1, 'y': -264.1, 'z': -372.8}},
-    33073: {'name': 'Degasi Seabase - Jellyshroom Cave - Bedroom PDA', 'need_laser_cutter': False, 'position': {'x': 112.3, 'y': -264.9, 'z': -369.3}},
-    33074: {'name': 'Degasi Seabase - Jellyshroom Cave - Observatory PDA', 'need_laser_cutter': False, 'position': {'x': 95.5, 'y': -258.9, 'z': -366.5}},
-    33075: {'name': 'Lifepod 2 - Databox', 'need_laser_cutter': False, 'position': {'x': -483.6, 'y': -504.7, 'z': 1326.6}},
-    33076: {'name': 'Lifepod 2 - PDA', 'need_laser_cutter': False, 'position': {'x': -481.4, 'y': -503.6, 'z': 1324.1}},
-    33077: {'name': 'Lifepod 3 - Databox', 'need_laser_cutter': False, 'position': {'x': -34.2, 'y': -22.4, 'z': 410.5}},
-    33078: {'name': 'Lifepod 3 - PDA', 'need_laser_cutter': False, 'position': {'x': -33.8, 'y': -22.5, 'z': 408.8}},
-    33079: {'name': 'Lifepod 4 - Databox', 'need_laser_cutter': False, 'position': {'x': 712.4, 'y': -3.4, 'z': 160.8}},
-    33080: {'name': 'Lifepod 4 - PDA', 'need_laser_cutter': False, 'position': {'x': 712.0, 'y': -3.5, 'z': 161.5}},
-    33081: {'name': 'Lifepod 6 - Databox', 'need_laser_cutter': False, 'position': {'x': 358.7, 'y': -117.1, 'z': 306.8}},
-    33082: {'name': 'Lifepod 6 - Inside PDA', 'need_laser_cutter': False, 'position': {'x': 361.8, 'y': -116.2, 'z': 309.5}},
-    33083: {'name': 'Lifepod 6 - Outside PDA', 'need_laser_cutter': False, 'position': {'x': 359.9, 'y': -117.0, 'z': 312.1}},
-    33084: {'name': 'Lifepod 7 - PDA', 'need_laser_cutter': False, 'position': {'x': -56.0, 'y': -182.0, 'z': -1039.0}},
-    33085: {'name': 'Lifepod 12 - Databox', 'need_laser_cutter': False, 'position': {'x': 1119.5, 'y': -271.7, 'z': 561.7}},
-    33086: {'name': 'Lifepod 12 - PDA', 'need_laser_cutter': False, 'position': {'x': 1116.1, 'y': -271.3, 'z': 566.9}},
-    33087: {'name': 'Lifepod 13 - Databox', 'need_laser_cutter': False, 'position': {'x': -926.4, 'y': -185.2, 'z': 501.8}},
-    33088: {'name': 'Lifepod 13 - PDA', 'need_laser_cutter': False, 'position': {'x': -926.8, 'y': -184.4, 'z': 506.6}},
-    33089: {'name': 'Lifepod 17 - PDA', 'need_laser_cutter': False, 'position': {'x': -514.5, 'y': -98.1, 'z': -56.5}},
-    33090: {'name': 'Lifepod 19 - Databox', 'need_laser_cutter': False, 'position': {'x': -809.8, 'y': -302.2, 'z': -876.9}},
-    33091: {'name': 'Lifepod 19 - Outside PDA', 'need_laser_cutter': False, 'position': {'x': -806.1, 'y': -294.1, 'z': -866.0}},
-    33092: {'name': 'Lifepod 19 - Inside PDA', 'need_laser_cutter': False, 'position': {'x': -810.5, 'y': -299.4, 'z': -873.1}},
-    33093: {'can_slip_through': 'propulsion', 'name': 'Aurora Seamoth Bay - Upgrade Console', 'need_laser_cutter': False, 'need_propulsion_cannon': True, 'position': {'x': 903.5, 'y': -0.2, 'z': 16.1}},
-    33094: {'can_slip_through': 'propulsion', 'name': 'Aurora Drive Room - Upgrade Console', 'need_laser_cutter': False, 'need_propulsion_cannon': True, 'position': {'x': 872.5, 'y': 2.7, 'z': -0.7}},
-    33095: {'can_slip_through': 'propulsion', 'name': 'Aurora Prawn Suit Bay - Upgrade Console', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 991.6, 'y': 3.2, 'z': -31.0}},
-    33096: {'can_slip_through': 'none', 'name': 'Aurora - Office PDA', 'need_laser_cutter': False, 'position': {'x': 952.1, 'y': 41.2, 'z': 113.9}},
-    33097: {'can_slip_through': 'none', 'name': 'Aurora - Corridor PDA', 'need_laser_cutter': False, 'position': {'x': 977.2, 'y': 39.1, 'z': 83.0}},
-    33098: {'can_slip_through': 'propulsion', 'name': 'Aurora - Cargo Bay PDA', 'need_laser_cutter': False, 'need_propulsion_cannon': True, 'position': {'x': 954.9, 'y': 11.2, 'z': 3.4}},
-    33099: {'can_slip_through': 'propulsion', 'name': 'Aurora - Seamoth Bay PDA', 'need_laser_cutter': False, 'need_propulsion_cannon': True, 'position': {'x': 907.1, 'y': -1.5, 'z': 15.3}},
-    33100: {'can_slip_through': 'propulsion', 'name': 'Aurora - Medkit Locker PDA', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 951.8, 'y': -2.3, 'z': -34.7}},
-    33101: {'can_slip_through': 'propulsion', 'name': 'Aurora - Locker PDA', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 952.0, 'y': -3.7, 'z': -23.4}},
-    33102: {'can_slip_through': 'propulsion', 'name': 'Aurora - Canteen PDA', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 986.5, 'y': 9.6, 'z': -48.6}},
-    33103: {'can_slip_through': 'propulsion', 'name': 'Aurora - Cabin 4 PDA', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 951.3, 'y': 11.2, 'z': -51.0}},
-    33104: {'can_slip_through': 'propulsion', 'name': 'Aurora - Cabin 7 PDA', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 967.1, 'y': 10.4, 'z': -47.4}},
-    33105: {'can_slip_through': 'propulsion', 'name': 'Aurora - Cabin 1 PDA', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 964.1, 'y': 11.1, 'z': -61.9}},
-    33106: {'can_slip_through': 'propulsion', 'name': 'Aurora - Captain PDA', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 971.2, 'y': 10.8, 'z': -70.4}},
-    33107: {'can_slip_through': 'none', 'name': 'Aurora - Ring PDA', 'need_laser_cutter': False, 'need_propulsion_cannon': True, 'position': {'x': 1033.6, 'y': -8.5, 'z': 16.2}},
-    33108: {'can_slip_through': 'none', 'name': 'Aurora - Lab PDA', 'need_laser_cutter': False, 'need_propulsion_cannon': True, 'position': {'x': 1032.5, 'y': -7.8, 'z': 32.4}},
-    33109: {'can_slip_through': 'none', 'name': 'Aurora - Office Data Terminal', 'need_laser_cutter': False, 'position': {'x': 945.8, 'y': 40.8, 'z': 115.1}},
-    33110: {'can_slip_through': 'propulsion', 'name': 'Aurora - Captain Data Terminal', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 974.8, 'y': 10.0, 'z': -77.0}},
-    33111: {'can_slip_through': 'propulsion', 'name': 'Aurora - Battery Room Data Terminal', 'need_laser_cutter': True, 'need_propulsion_cannon': True, 'position': {'x': 1040.8, 'y': -11.4, 'z': -3.4}},
-    33112: {'can_slip_through': 'propulsion', 'name': 'Aurora - Lab Data Terminal', 'need_laser_cutter': False, 'need_propulsion_cannon': True, 'position': {'x': 1029.5, 'y': -8.7, 'z': 35.9}},
-    33113: {'name': "Quarantine Enforcement Platform's - Upper Alien Data " 'Terminal', 'need_laser_cutter': False, 'position': {'x': 432.2, 'y': 3.0, 'z': 1193.2}},
-    33114: {'name': "Quarantine Enforcement Platform's - Mid Alien Data Terminal", 'need_laser_cutter': False, 'position': {'x': 474.4, 'y': -4.5, 'z': 1224.4}},
-    33115: {'name': 'Dunes Sanctuary - Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -1224.2, 'y': -400.4, 'z': 1057.9}},
-    33116: {'name': 'Deep Sparse Reef Sanctuary - Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -895.5, 'y': -311.6, 'z': -838.1}},
-    33117: {'name': 'Northern Blood Kelp Zone Sanctuary - Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -642.9, 'y': -563.5, 'z': 1485.5}},
-    33118: {'name': 'Lost River Laboratory Cache - Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -1112.3, 'y': -687.3, 'z': -695.5}},
-    33119: {'name': 'Disease Research Facility - Upper Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -280.2, 'y': -804.3, 'z': 305.1}},
-    33120: {'name': 'Disease Research Facility - Mid Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -267.9, 'y': -806.6, 'z': 250.0}},
-    33121: {'name': 'Disease Research Facility - Lower Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -286.2, 'y': -815.6, 'z': 297.8}},
-    33122: {'name': 'Alien Thermal Plant - Entrance Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -71.3, 'y': -1227.2, 'z': 104.8}},
-    33123: {'name': 'Alien Thermal Plant - Green Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -38.7, 'y': -1226.6, 'z': 111.8}},
-    33124: {'name': 'Alien Thermal Plant - Yellow Alien Data Terminal', 'need_laser_cutter': False, 'position': {'x': -30.4, 'y': -1220.3, 'z': 111.8}},
-    33125: {'name': "Primary Containment Facility's Antechamber - Alien Data " 'Terminal', 'need_laser_cutter': False, 'position': {'x': 245.8, 'y': -1430.6, 'z': -311.5}},
-    33126: {'name': "Primary Containment Facility's Egg Laboratory - Alien Data " 'Terminal', 'need_laser_cutter': False, 'position': {'x': 165.5, 'y': -1442.4, 'z': -385.8}},
-    33127: {'name': "Primary Containment Facility's Pipe Room - Alien Data " 'Terminal', 'need_laser_cutter': False, 'position': {'x': 348.7, 'y': -1443.5, 'z': -291.9}},
-    33128: {'name': 'Grassy Plateaus West Wreck - Beam PDA', 'need_laser_cutter': False, 'position': {'x': -641.8, 'y': -111.3, 'z': -19.7}},
-    33129: {'name': 'Floating Island - Cave Entrance PDA', 'need_laser_cutter': False, 'position': {'x': -748.9, 'y': 14.4, 'z': -1179.5}},
-    33130: {'name': 'Degasi Seabase - Jellyshroom Cave - Outside PDA', 'need_laser_cutter': False, 'position': {'x': 83.2, 'y': -276.4, 'z': -345.5}},
+location_table: Dict[int, LocationRecord] = {
+    33000: LocationRecord('Blood Kelp Trench Wreck - Outside Databox', -1234.3, -349.7, -396.0),
+    33001: LocationRecord('Blood Kelp Trench Wreck - Inside Databox', -1208.0, -349.6, -383.0),
+    33002: LocationRecord('Blood Kelp Trench Wreck - PDA', -1210.6, -340.7, -393.4),
+    33003: LocationRecord('Bulb Zone West Wreck - Outside Databox', 903.8, -220.3, 590.9),
+    33004: LocationRecord('Bulb Zone West Wreck - Under Databox', 910.9, -201.8, 623.5),
+    33005: LocationRecord('Bulb Zone West Wreck - Inside Databox', 914.9, -202.1, 611.8, need_laser_cutter=True),
+    33006: LocationRecord('Bulb Zone West Wreck - PDA', 912.6, -202.0, 609.5, need_laser_cutter=True),
+    33007: LocationRecord('Bulb Zone East Wreck - Databox', 1327.1, -234.9, 575.8),
+    33008: LocationRecord('Dunes North Wreck - Outside Databox', -1407.7, -344.2, 721.5),
+    33009: LocationRecord('Dunes North Wreck - Office Databox', -1393.9, -329.7, 733.5),
+    33010: LocationRecord('Dunes North Wreck - PDA', -1396.3, -330.8, 730.0),
+    33011: LocationRecord('Dunes North Wreck - Cargo Databox', -1409.8, -332.4, 706.9, need_laser_cutter=True),
+    33012: LocationRecord('Dunes West Wreck - Databox', -1626.2, -357.5, 99.5),
+    33013: LocationRecord('Dunes East Wreck - Outside Databox', -1196.3, -223.0, 12.5),
+    33014: LocationRecord('Dunes East Wreck - Inside Databox', -1206.4, -225.6, 4.0),
+    33015: LocationRecord('Grand Reef North Wreck - Outside Databox', -269.7, -262.8, -764.3),
+    33016: LocationRecord('Grand Reef North Wreck - Elevator Databox', -285.8, -240.2, -786.5, need_laser_cutter=True),
+    33017: LocationRecord('Grand Reef North Wreck - Bottom Databox', -285.2, -262.4, -788.4),
+    33018: LocationRecord('Grand Reef North Wreck - Hangar PDA', -272.5, -254.7, -788.5),
+    33019: LocationRecord('Grand Reef South Wreck - Trench Databox', -850.9, -473.2, -1414.6),
+    33020: LocationRecord('Grand Reef South Wreck - Comms Databox', -889.4, -433.8, -1424.8, need_laser_cutter=True),
+    33021: LocationRecord('Grand Reef South Wreck - Outside Databox', -862.4, -437.5, -1444.1),
+    33022: LocationRecord('Grand Reef South Wreck - PDA', -887.9, -446.0, -1422.7),
+    33023: LocationRecord('Grassy Plateaus South Wreck - Databox', -23.3, -105.8, -604.2),
+    33024: LocationRecord('Grassy Plateaus South Wreck - PDA', -27.3, -106.8, -607.2),
+    33025: LocationRecord('Grassy Plateaus East Wreck - Breach Databox', 313.9, -91.8, 432.6, need_laser_cutter=True, can_slip_through='laser'),
+    33026: LocationRecord('Grassy Plateaus East Wreck - Hangar Databox', 319.4, -104.3, 441.5, need_laser_cutter=True, can_slip_through='laser'),
+    33027: LocationRecord('Grassy Plateaus West Wreck - Locker PDA', -632.3, -75.0, -8.9),
+    33028: LocationRecord('Grassy Plateaus West Wreck - Data Terminal', -664.4, -97.8, -8.0),
+    33029: LocationRecord('Grassy Plateaus Southwest Wreck - Databox', -421.4, -107.8, -266.5, need_laser_cutter=True),
+    33030: LocationRecord('Safe Shallows Wreck - PDA', -44.0, -29.1, -403.6),
+    33031: LocationRecord('Kelp Forest Wreck - Databox', -317.6, -78.8, 247.4),
+    33032: LocationRecord('Kelp Forest Wreck - PDA', 63.2, -38.5, 382.9),
+    33033: LocationRecord('Mountains West Wreck - Outside Databox', 740.3, -389.2, 1179.8),
+    33034: LocationRecord('Mountains West Wreck - Data Terminal', 703.7, -365.9, 1199.3, need_laser_cutter=True),
+    33035: LocationRecord('Mountains West Wreck - Hangar Databox', 698.2, -350.8, 1186.9, need_laser_cutter=True),
+    33036: LocationRecord('Mountains West Wreck - Office Databox', 676.3, -343.6, 1204.6),
+    33037: LocationRecord('Mountains East Wreck - Comms Databox', 1068.5, -283.4, 1345.3),
+    33038: LocationRecord('Mountains East Wreck - Outside Databox', 1075.7, -288.9, 1321.8),
+    33039: LocationRecord('Northwestern Mushroom Forest Wreck - Cargo Databox', -655.1, -109.6, 791.0, need_laser_cutter=True),
+    33040: LocationRecord('Northwestern Mushroom Forest Wreck - Office Databox', -663.4, -111.9, 777.9),
+    33041: LocationRecord('Northwestern Mushroom Forest Wreck - PDA', -662.2, -113.4, 777.7),
+    33042: LocationRecord("Sea Treader's Path Wreck - Outside Databox", -1161.1, -191.7, -758.3),
+    33043: LocationRecord("Sea Treader's Path Wreck - Hangar Databox", -1129.5, -155.2, -729.3, need_laser_cutter=True),
+    33044: LocationRecord("Sea Treader's Path Wreck - Lobby Databox", -1115.9, -175.3, -724.5),
+    33045: LocationRecord("Sea Treader's Path Wreck - PDA", -1136.8, -157.0, -734.6),
+    33046: LocationRecord('Sparse Reef Wreck - Locker Databox', -789.8, -216.1, -711.0, need_laser_cutter=True),
+    33047: LocationRecord('Sparse Reef Wreck - Outside Databox', -810.7, -209.3, -685.5),
+    33048: LocationRecord('Sparse Reef Wreck - Lab Databox', -795.5, -204.1, -774.7, need_laser_cutter=True),
+    33049: LocationRecord('Underwater Islands Wreck - Outside Databox', -170.8, -187.6, 880.7),
+    33050: LocationRecord('Underwater Islands Wreck - Hangar Databox', -138.4, -193.6, 888.7, need_laser_cutter=True),
+    33051: LocationRecord('Underwater Islands Wreck - Data Terminal', -130.7, -193.2, 883.3, need_laser_cutter=True),
+    33052: LocationRecord('Underwater Islands Wreck - Cable Databox', -137.8, -193.4, 879.4),
+    33053: LocationRecord('Underwater Islands Wreck - Pipes Databox 1', -124.4, -200.7, 853.0, need_propulsion_cannon=True),
+    33054: LocationRecord('Underwater Islands Wreck - Pipes Databox 2', -126.8, -201.1, 852.1, need_propulsion_cannon=True),
+    33055: LocationRecord('Degasi Seabase - Deep Grand Reef - Bedroom Databox', -643.8, -509.9, -941.9),
+    33056: LocationRecord('Degasi Seabase - Deep Grand Reef - Observatory Databox', -635.1, -502.7, -951.4),
+    33057: LocationRecord('Degasi Seabase - Deep Grand Reef - Bedroom PDA', -645.8, -508.7, -943.0),
+    33058: LocationRecord('Degasi Seabase - Deep Grand Reef - Outside PDA', -630.5, -511.1, -936.1),
+    33059: LocationRecord('Degasi Seabase - Deep Grand Reef - Observatory PDA', -647.7, -502.6, -935.8),
+    33060: LocationRecord('Degasi Seabase - Deep Grand Reef - Lab PDA', -639.6, -505.9, -946.6),
+    33061: LocationRecord('Floating Island - Lake PDA', -707.2, 0.5, -1096.7),
+    33062: LocationRecord('Degasi Seabase - Floating Island - Databox', -765.7, 17.6, -1116.4),
+    33063: LocationRecord('Degasi Seabase - Floating Island - Room PDA', -754.9, 14.6, -1108.9),
+    33064: LocationRecord('Degasi Seabase - Floating Island - Green Wall PDA', -765.3, 14.1, -1115.0),
+    33065: LocationRecord('Degasi Seabase - Floating Island - Corridor PDA', -758.6, 14.1, -1111.3),
+    33066: LocationRecord('Degasi Seabase - Floating Island - North Observatory PDA', -805.4, 76.9, -1055.7),
+    33067: LocationRecord('Degasi Seabase - Floating Island - South Observatory PDA', -715.9, 75.4, -1168.8),
+    33068: LocationRecord('Jellyshroom Cave - PDA', -540.5, -250.8, -83.4),
+    33069: LocationRecord('Degasi Seabase - Jellyshroom Cave - Bedroom Databox', 110.6, -264.9, -369.0),
+    33070: LocationRecord('Degasi Seabase - Jellyshroom Cave - Detached PDA', 80.6, -268.6, -358.3),
+    33071: LocationRecord('Degasi Seabase - Jellyshroom Cave - Office PDA', 78.2, -265.0, -373.4),
+    33072: LocationRecord('Degasi Seabase - Jellyshroom Cave - Locker PDA', 85.1, -264.1, -372.8),
+    33073: LocationRecord('Degasi Seabase - Jellyshroom Cave - Bedroom PDA', 112.3, -264.9, -369.3),
+    33074: LocationRecord('Degasi Seabase - Jellyshroom Cave - Observatory PDA', 95.5, -258.9, -366.5),
+    33075: LocationRecord('Lifepod 2 - Databox', -483.6, -504.7, 1326.6),
+    33076: LocationRecord('Lifepod 2 - PDA', -481.4, -503.6, 1324.1),
+    33077: LocationRecord('Lifepod 3 - Databox', -34.2, -22.4, 410.5),
+    33078: LocationRecord('Lifepod 3 - PDA', -33.8, -22.5, 408.8),
+    33079: LocationRecord('Lifepod 4 - Databox', 712.4, -3.4, 160.8),
+    33080: LocationRecord('Lifepod 4 - PDA', 712.0, -3.5, 161.5),
+    33081: LocationRecord('Lifepod 6 - Databox', 358.7, -117.1, 306.8),
+    33082: LocationRecord('Lifepod 6 - Inside PDA', 361.8, -116.2, 309.5),
+    33083: LocationRecord('Lifepod 6 - Outside PDA', 359.9, -117.0, 312.1),
+    33084: LocationRecord('Lifepod 7 - PDA', -56.0, -182.0, -1039.0),
+    33085: LocationRecord('Lifepod 12 - Databox', 1119.5, -271.7, 561.7),
+    33086: LocationRecord('Lifepod 12 - PDA', 1116.1, -271.3, 566.9),
+    33087: LocationRecord('Lifepod 13 - Databox', -926.4, -185.2, 501.8),
+    33088: LocationRecord('Lifepod 13 - PDA', -926.8, -184.4, 506.6),
+    33089: LocationRecord('Lifepod 17 - PDA', -514.5, -98.1, -56.5),
+    33090: LocationRecord('Lifepod 19 - Databox', -809.8, -302.2, -876.9),
+    33091: LocationRecord('Lifepod 19 - Outside PDA', -806.1, -294.1, -866.0),
+    33092: LocationRecord('Lifepod 19 - Inside PDA', -810.5, -299.4, -873.1),
+    33093: LocationRecord('Aurora Seamoth Bay - Upgrade Console', 903.5, -0.2, 16.1, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33094: LocationRecord('Aurora Drive Room - Upgrade Console', 872.5, 2.7, -0.7, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33095: LocationRecord('Aurora Prawn Suit Bay - Upgrade Console', 991.6, 3.2, -31.0, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33096: LocationRecord('Aurora - Office PDA', 952.1, 41.2, 113.9),
+    33097: LocationRecord('Aurora - Corridor PDA', 977.2, 39.1, 83.0),
+    33098: LocationRecord('Aurora - Cargo Bay PDA', 954.9, 11.2, 3.4, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33099: LocationRecord('Aurora - Seamoth Bay PDA', 907.1, -1.5, 15.3, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33100: LocationRecord('Aurora - Medkit Locker PDA', 951.8, -2.3, -34.7, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33101: LocationRecord('Aurora - Locker PDA', 952.0, -3.7, -23.4, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33102: LocationRecord('Aurora - Canteen PDA', 986.5, 9.6, -48.6, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33103: LocationRecord('Aurora - Cabin 4 PDA', 951.3, 11.2, -51.0, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33104: LocationRecord('Aurora - Cabin 7 PDA', 967.1, 10.4, -47.4, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33105: LocationRecord('Aurora - Cabin 1 PDA', 964.1, 11.1, -61.9, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33106: LocationRecord('Aurora - Captain PDA', 971.2, 10.8, -70.4, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33107: LocationRecord('Aurora - Ring PDA', 1033.6, -8.5, 16.2, need_propulsion_cannon=True),
+    33108: LocationRecord('Aurora - Lab PDA', 1032.5, -7.8, 32.4, need_propulsion_cannon=True),
+    33109: LocationRecord('Aurora - Office Data Terminal', 945.8, 40.8, 115.1),
+    33110: LocationRecord('Aurora - Captain Data Terminal', 974.8, 10.0, -77.0, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33111: LocationRecord('Aurora - Battery Room Data Terminal', 1040.8, -11.4, -3.4, need_laser_cutter=True, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33112: LocationRecord('Aurora - Lab Data Terminal', 1029.5, -8.7, 35.9, need_propulsion_cannon=True, can_slip_through='propulsion'),
+    33113: LocationRecord("Quarantine Enforcement Platform's - Upper Alien Data Terminal", 432.2, 3.0, 1193.2),
+    33114: LocationRecord("Quarantine Enforcement Platform's - Mid Alien Data Terminal", 474.4, -4.5, 1224.4),
+    33115: LocationRecord('Dunes Sanctuary - Alien Data Terminal', -1224.2, -400.4, 1057.9),
+    33116: LocationRecord('Deep Sparse Reef Sanctuary - Alien Data Terminal', -895.5, -311.6, -838.1),
+    33117: LocationRecord('Northern Blood Kelp Zone Sanctuary - Alien Data Terminal', -642.9, -563.5, 1485.5),
+    33118: LocationRecord('Lost River Laboratory Cache - Alien Data Terminal', -1112.3, -687.3, -695.5),
+    33119: LocationRecord('Disease Research Facility - Upper Alien Data Terminal', -280.2, -804.3, 305.1),
+    33120: LocationRecord('Disease Research Facility - Mid Alien Data Terminal', -267.9, -806.6, 250.0),
+    33121: LocationRecord('Disease Research Facility - Lower Alien Data Terminal', -286.2, -815.6, 297.8),
+    33122: LocationRecord('Alien Thermal Plant - Entrance Alien Data Terminal', -71.3, -1227.2, 104.8),
+    33123: LocationRecord('Alien Thermal Plant - Green Alien Data Terminal', -38.7, -1226.6, 111.8),
+    33124: LocationRecord('Alien Thermal Plant - Yellow Alien Data Terminal', -30.4, -1220.3, 111.8),
+    33125: LocationRecord("Primary Containment Facility's Antechamber - Alien Data Terminal", 245.8, -1430.6, -311.5),
+    33126: LocationRecord("Primary Containment Facility's Egg Laboratory - Alien Data Terminal", 165.5, -1442.4, -385.8),
+    33127: LocationRecord("Primary Containment Facility's Pipe Room - Alien Data Terminal", 348.7, -1443.5, -291.9),
+    33128: LocationRecord('Grassy Plateaus West Wreck - Beam PDA', -641.8, -111.3, -19.7),
+    33129: LocationRecord('Floating Island - Cave Entrance PDA', -748.9, 14.4, -1179.5),
+    33130: LocationRecord('Degasi Seabase - Jellyshroom Cave - Outside PDA', 83.2, -276.4, -345.5),
 }
+
+
+@functools.cache
+def get_location_flag_table() -> Dict[int, int]:
+    """LocationFlag bits of every location_table entry, built on first use rather than on import."""
+    return {loc_id: get_location_flags(loc) for loc_id, loc in location_table.items()}
@@ -8,6 +8,7 @@ from Options import (
 )
 from .creatures import all_creatures, Definitions
 from .items import ItemType, item_names_by_type
+from .locations import LocationFlag
 from .plants import all_flora, plant_locations
 
 
@@ -152,6 +153,15 @@ class CanSlipThrough(Choice):
     option_propulsion_cannon = 2
     option_both = 3
 
+    def get_tool_flags(self) -> int:
+        """Tools, as LocationFlag bits, whose segments the player is willing to slip through."""
+        return {
+            self.option_none: LocationFlag.none,
+            self.option_laser_cutter: LocationFlag.laser_cutter,
+            self.option_propulsion_cannon: LocationFlag.propulsion_cannon,
+            self.option_both: LocationFlag.laser_cutter | LocationFlag.propulsion_cannon,
+        }[self.value]
+
 
 class Goal(Choice):
     """Goal to complete.
@@ -241,6 +251,13 @@ class EmptyTanks(Toggle):
     """Oxygen Tanks stored in inventory are empty if enabled."""
 
 
+class LogicRegions(Toggle):
+    """Split the planet into depth, radiation and seaglide distance regions during generation.
+    This does not change what is in logic; it only lets generation skip whole groups of unreachable checks,
+    which helps with large multiworlds."""
+    display_name = "Logic Regions"
+
+
 @dataclass
 class SubnauticaOptions(PerGameCommonOptions):
     classic: Classic
@@ -266,3 +283,4 @@ class SubnauticaOptions(PerGameCommonOptions):
     start_inventory_from_pool: StartInventoryPool
     filler_items_distribution: FillerItemsDistribution
     empty_tanks: EmptyTanks
+    logic_regions: LogicRegions
@@ -1,69 +1,63 @@
 import functools
-from typing import Dict, TypedDict, List
+from typing import Dict
 
-class Vector(TypedDict):
-    x: float
-    y: float
-    z: float
+from .locations import LocationRecord
 
-class FloraDict(TypedDict):
-    name: str
-    position: Vector
+# Flora scans are locations without tool requirements, so they share the record type,
+# which saves creating another NamedTuple class on import.
+FloraRecord = LocationRecord
 
-all_flora: Dict[int, FloraDict] = {
-    34100: { 'name': 'Acid Mushroom', 'position': {'x': 0, 'y': 0, 'z': 0} },
-    34101: { 'name': 'Anchor Pods', 'position': {'x': -250, 'y': -99, 'z': -690} },
-    34102: { 'name': 'Bloodroot', 'position': {'x': -1068, 'y': -378, 'z': -605} },
-    34103: { 'name': 'Bloodvine', 'position': {'x': -807, 'y': -219, 'z': 892} },
-    34104: { 'name': 'Blue Palm', 'position': {'x': 0, 'y': 0, 'z': 0} },
-    34105: { 'name': 'Brine Lily', 'position': {'x': -1264, 'y': -649, 'z': -215} },
-    34106: { 'name': 'Bulb Bush', 'position': {'x': 690, 'y': -137, 'z': 835} },
-    34107: { 'name': 'Bulbo Tree', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34108: { 'name': 'Cave Bush', 'position': {'x': 358, 'y': -28, 'z': 1067} },
-    34109: { 'name': 'Chinese Potato Plant', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34110: { 'name': 'Crab Claw Kelp', 'position': {'x': -1081, 'y': -713, 'z': -588} },
-    34111: { 'name': 'Creepvine', 'position': {'x': 0, 'y': 0, 'z': 0} },
-    34112: { 'name': 'Creepvine Seeds', 'position': {'x': 0, 'y': 0, 'z': 0} },
-    34113: { 'name': 'Deep Shroom', 'position': {'x': -807, 'y': -219, 'z': 892} },
-    34114: { 'name': 'Drooping Stingers', 'position': {'x': -318, 'y': -79, 'z': 247} },
-    34115: { 'name': 'Eye Stalk', 'position': {'x': -34, 'y': -22, 'z': 411} },
-    34116: { 'name': 'Fern Palm', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34117: { 'name': 'Furled Papyrus', 'position': {'x': -496, 'y': -114, 'z': -11} },
-    34118: { 'name': "Gabe's Feather", 'position': {'x': -795, 'y': -239, 'z': -360} },
-    34119: { 'name': 'Gel Sack', 'position': {'x': 432, 'y': 3, 'z': 1193} },
-    34120: { 'name': 'Ghost Weed', 'position': {'x': -780, 'y': -234, 'z': 950} },
-    34121: { 'name': 'Giant Cove Tree', 'position': { 'x': -860, 'y': -920, 'z': 340} },
-    34122: { 'name': 'Grub Basket' ,'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34123: { 'name': 'Jaffa Cup', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34124: { 'name': 'Jellyshroom', 'position': {'x': -350, 'y': -152, 'z': -208} },
-    34125: { 'name': 'Lantern Tree', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34126: { 'name': 'Marblemelon Plant', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34127: { 'name': 'Membrain Tree', 'position': {'x': -382, 'y': -133, 'z': -669} },
-    34128: { 'name': 'Ming Plant', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34129: { 'name': 'Pink Cap', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34130: { 'name': 'Pygmy Fan', 'position': {'x': -670, 'y': -190, 'z': 714} },
-    34131: { 'name': 'Redwort', 'position': {'x': 384, 'y': -87, 'z': 1013} },
-    34132: { 'name': 'Regress Shell', 'position': {'x': 384, 'y': -87, 'z': 1013} },
-    34133: { 'name': 'Rouge Cradle', 'position': {'x': -496, 'y': 114, 'z': -11} },
-    34134: { 'name': 'Sea Crown', 'position': {'x': -797, 'y': -143, 'z': -152} },
-    34135: { 'name': 'Speckled Rattler', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34136: { 'name': 'Spiked Horn Grass', 'position': {'x': 334, 'y': -87, 'z': 1013} },
-    34137: { 'name': 'Spotted Dockleaf', 'position': {'x': 334, 'y': -87, 'z': 1013} },
-    34138: { 'name': 'Sulfer Plant', 'position': {'x': 0, 'y': 0, 'z': 0} },
-    34139: { 'name': 'Tiger Plant', 'position': {'x': -100, 'y': -100, 'z': -100} },
-    34140: { 'name': 'Tree Leech', 'position': {'x': 363, 'y': -17, 'z': 1050} },
-    34141: { 'name': 'Veined Nettle', 'position': {'x': 0, 'y': 0, 'z': 0} },
-    34142: { 'name': 'Violet Beau', 'position': {'x': -496, 'y': -114, 'z': -11} },
-    34143: { 'name': 'Voxel Shrub', 'position': {'x': -707, 'y': 1, 'z': -1097} },
-    34144: { 'name': 'Writhing Weed', 'position': {'x': 0, 'y': 0, 'z': 0} }
+
+all_flora: Dict[int, FloraRecord] = {
+    34100: FloraRecord('Acid Mushroom', 0.0, 0.0, 0.0),
+    34101: FloraRecord('Anchor Pods', -250.0, -99.0, -690.0),
+    34102: FloraRecord('Bloodroot', -1068.0, -378.0, -605.0),
+    34103: FloraRecord('Bloodvine', -807.0, -219.0, 892.0),
+    34104: FloraRecord('Blue Palm', 0.0, 0.0, 0.0),
+    34105: FloraRecord('Brine Lily', -1264.0, -649.0, -215.0),
+    34106: FloraRecord('Bulb Bush', 690.0, -137.0, 835.0),
+    34107: FloraRecord('Bulbo Tree', -707.0, 1.0, -1097.0),
+    34108: FloraRecord('Cave Bush', 358.0, -28.0, 1067.0),
+    34109: FloraRecord('Chinese Potato Plant', -707.0, 1.0, -1097.0),
+    34110: FloraRecord('Crab Claw Kelp', -1081.0, -713.0, -588.0),
+    34111: FloraRecord('Creepvine', 0.0, 0.0, 0.0),
+    34112: FloraRecord('Creepvine Seeds', 0.0, 0.0, 0.0),
+    34113: FloraRecord('Deep Shroom', -807.0, -219.0, 892.0),
+    34114: FloraRecord('Drooping Stingers', -318.0, -79.0, 247.0),
+    34115: FloraRecord('Eye Stalk', -34.0, -22.0, 411.0),
+    34116: FloraRecord('Fern Palm', -707.0, 1.0, -1097.0),
+    34117: FloraRecord('Furled Papyrus', -496.0, -114.0, -11.0),
+    34118: FloraRecord("Gabe's Feather", -795.0, -239.0, -360.0),
+    34119: FloraRecord('Gel Sack', 432.0, 3.0, 1193.0),
+    34120: FloraRecord('Ghost Weed', -780.0, -234.0, 950.0),
+    34121: FloraRecord('Giant Cove Tree', -860.0, -920.0, 340.0),
+    34122: FloraRecord('Grub Basket', -707.0, 1.0, -1097.0),
+    34123: FloraRecord('Jaffa Cup', -707.0, 1.0, -1097.0),
+    34124: FloraRecord('Jellyshroom', -350.0, -152.0, -208.0),
+    34125: FloraRecord('Lantern Tree', -707.0, 1.0, -1097.0),
+    34126: FloraRecord('Marblemelon Plant', -707.0, 1.0, -1097.0),
+    34127: FloraRecord('Membrain Tree', -382.0, -133.0, -669.0),
+    34128: FloraRecord('Ming Plant', -707.0, 1.0, -1097.0),
+    34129: FloraRecord('Pink Cap', -707.0, 1.0, -1097.0),
+    34130: FloraRecord('Pygmy Fan', -670.0, -190.0, 714.0),
+    34131: FloraRecord('Redwort', 384.0, -87.0, 1013.0),
+    34132: FloraRecord('Regress Shell', 384.0, -87.0, 1013.0),
+    34133: FloraRecord('Rouge Cradle', -496.0, 114.0, -11.0),
+    34134: FloraRecord('Sea Crown', -797.0, -143.0, -152.0),
+    34135: FloraRecord('Speckled Rattler', -707.0, 1.0, -1097.0),
+    34136: FloraRecord('Spiked Horn Grass', 334.0, -87.0, 1013.0),
+    34137: FloraRecord('Spotted Dockleaf', 334.0, -87.0, 1013.0),
+    34138: FloraRecord('Sulfer Plant', 0.0, 0.0, 0.0),
+    34139: FloraRecord('Tiger Plant', -100.0, -100.0, -100.0),
+    34140: FloraRecord('Tree Leech', 363.0, -17.0, 1050.0),
+    34141: FloraRecord('Veined Nettle', 0.0, 0.0, 0.0),
+    34142: FloraRecord('Violet Beau', -496.0, -114.0, -11.0),
+    34143: FloraRecord('Voxel Shrub', -707.0, 1.0, -1097.0),
+    34144: FloraRecord('Writhing Weed', 0.0, 0.0, 0.0),
 }
 
 suffix: str = " Scan"
 
 plant_locations: Dict[str, int] = {
-    data["name"] + suffix: loc_id for loc_id, data in all_flora.items()
+    data.name + suffix: loc_id for loc_id, data in all_flora.items()
 }
-
-all_plants_presorted: List[str] = [
-    name for loc_id, name in all_flora.items()
-]
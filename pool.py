@@ -0,0 +1,36 @@
+"""item_table entries as create_items needs them, worked out once per process.
+Only create_items imports this, so tooling importing the world doesn't build them."""
+
+import itertools
+from typing import Dict, FrozenSet, NamedTuple, Tuple
+
+from BaseClasses import ItemClassification as IC
+from .items import ItemData, base_item_table, group_items, non_vehicle_depth_table, seamoth_table, prawn_table, \
+    cyclops_table
+
+
+class PoolEntry(NamedTuple):
+    """An item_table entry as create_items needs it, so building the pool skips the per item lookups."""
+    item_id: int
+    name: str
+    classification: IC
+    count: int
+
+
+def get_pool_entries(table: Dict[int, ItemData]) -> Tuple[PoolEntry, ...]:
+    return tuple(PoolEntry(item_id, data.name, data.classification, data.count)
+                 for item_id, data in table.items() if data.count)
+
+
+# Items that only enter the pool through their group item
+grouped_item_ids: FrozenSet[int] = frozenset(itertools.chain.from_iterable(group_items.values()))
+grouped_item_count: int = sum(data.count for item_id, data in base_item_table.items() if item_id in grouped_item_ids)
+
+base_pool_entries: Tuple[PoolEntry, ...] = get_pool_entries(
+    {item_id: data for item_id, data in base_item_table.items() if item_id not in grouped_item_ids})
+non_vehicle_depth_pool_entries: Tuple[PoolEntry, ...] = get_pool_entries(non_vehicle_depth_table)
+seamoth_pool_entries: Tuple[PoolEntry, ...] = get_pool_entries(seamoth_table)
+prawn_pool_entries: Tuple[PoolEntry, ...] = get_pool_entries(prawn_table)
+cyclops_pool_entries: Tuple[PoolEntry, ...] = get_pool_entries(cyclops_table)
+
+non_vehicle_depth_item_names: FrozenSet[str] = frozenset(data.name for data in non_vehicle_depth_table.values())
@@ -0,0 +1,56 @@
+"""Opt-in profiling of the access rules set in rules.py.
+
+Set the SUBNAUTICA_RULE_PROFILE environment variable before generating to enable it. Every rule of a
+Subnautica slot then records its call count, cumulative time and how often it returned True, and a
+report sorted by time is logged at the end of generation. When disabled, rules are left untouched."""
+
+import logging
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+if TYPE_CHECKING:
+    from BaseClasses import CollectionState
+
+
+class RuleStats:
+    __slots__ = ("calls", "true_results", "seconds")
+    calls: int
+    true_results: int
+    seconds: float
+
+    def __init__(self):
+        self.calls = 0
+        self.true_results = 0
+        self.seconds = 0.0
+
+
+class RuleProfiler:
+    stats: Dict[str, RuleStats]
+
+    def __init__(self):
+        self.stats = {}
+
+    def wrap(self, name: str, rule: Callable[["CollectionState"], bool]) -> Callable[["CollectionState"], bool]:
+        stats = self.stats.setdefault(name, RuleStats())
+        perf_counter = time.perf_counter
+
+        def profiled_rule(state: "CollectionState") -> bool:
+            start = perf_counter()
+            result = rule(state)
+            stats.seconds += perf_counter() - start
+            stats.calls += 1
+            if result:
+                stats.true_results += 1
+            return result
+
+        return profiled_rule
+
+    def get_report(self) -> List[str]:
+        lines = [f"{'rule':<64} {'calls':>9} {'time (ms)':>10} {'true':>6}"]
+        for name, stats in sorted(self.stats.items(), key=lambda item: item[1].seconds, reverse=True):
+            true_ratio = stats.true_results / stats.calls if stats.calls else 0.0
+            lines.append(f"{name:<64} {stats.calls:>9} {stats.seconds * 1000:>10.2f} {true_ratio:>6.1%}")
+        return lines
+
+    def log_report(self, player_name: str) -> None:
+        logging.info(f"Subnautica rule profile for {player_name}:\n" + "\n".join(self.get_report()))
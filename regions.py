@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING, Callable, Dict, NamedTuple, Tuple
+
+from BaseClasses import Region
+from .creatures import all_creatures, creature_locations, suffix
+from .rules import LocationRequirement, has_seaglide_or_vehicle
+
+if TYPE_CHECKING:
+    from . import SubnauticaWorld
+    from BaseClasses import CollectionState
+
+
+# Lowest depth of each band; the band's region is entered once the max depth reaches it.
+depth_bands: Tuple[int, ...] = (0, 200, 300, 500, 900, 1300)
+
+creature_names: Dict[int, str] = {loc_id: name[:-len(suffix)] for name, loc_id in creature_locations.items()}
+
+
+class RegionKey(NamedTuple):
+    radiation_suit: bool
+    seaglide_or_vehicle: bool
+    band: int
+
+
+def get_band(depth: int) -> int:
+    band = 0
+    for index, floor in enumerate(depth_bands):
+        if depth >= floor:
+            band = index
+    return band
+
+
+def get_region_key(requirement: LocationRequirement) -> RegionKey:
+    return RegionKey(requirement.radiation_suit, requirement.seaglide_or_vehicle, get_band(requirement.depth))
+
+
+def get_region_name(origin_name: str, key: RegionKey) -> str:
+    name = origin_name
+    if key.radiation_suit:
+        name += " - Radiation Zone"
+    if key.seaglide_or_vehicle:
+        name += " - Beyond Pre-Seaglide"
+    if key.band:
+        name += f" - {depth_bands[key.band]}m"
+    return name
+
+
+class LogicRegions:
+    """Region graph for the logic_regions option.
+
+    Every region adds exactly one requirement on top of its parent: the radiation suit, a seaglide or
+    vehicle, or reaching the next depth band. Locations are placed in the region whose requirements
+    their own rule already implies, so access stays the same while unreachable regions skip all
+    their locations at once."""
+    world: "SubnauticaWorld"
+    regions: Dict[RegionKey, Region]
+
+    def __init__(self, world: "SubnauticaWorld", origin: Region):
+        self.world = world
+        self.regions = {RegionKey(False, False, 0): origin}
+
+    def get_region(self, key: RegionKey) -> Region:
+        region = self.regions.get(key)
+        if region is None:
+            parent, rule = self.get_parent(key)
+            origin_name = self.world.origin_region_name
+            region = Region(get_region_name(origin_name, key), self.world.player, self.world.multiworld)
+            self.get_region(parent).connect(region, rule=rule)
+            self.world.multiworld.regions.append(region)
+            self.regions[key] = region
+        return region
+
+    def get_parent(self, key: RegionKey) -> Tuple[RegionKey, Callable[["CollectionState"], bool]]:
+        player = self.world.player
+        options = self.world.options
+        if key.band:
+            depth_cache = self.world.depth_cache
+            floor = depth_bands[key.band]
+            return key._replace(band=key.band - 1), lambda state: depth_cache.get(state) >= floor
+        if key.seaglide_or_vehicle:
+            return key._replace(seaglide_or_vehicle=False), \
+                lambda state: has_seaglide_or_vehicle(state, player, options)
+        return key._replace(radiation_suit=False), lambda state: state.has("Radiation Suit", player)
+
+    def get_location_region(self, loc_id: int) -> Region:
+        requirement = self.world.shared_logic.requirements.get(loc_id)
+        if requirement is not None:
+            key = get_region_key(requirement)
+        else:
+            # creature scans always need the seaglide, which is more than the seaglide or vehicle region asks for
+            key = RegionKey(False, True, get_band(all_creatures[creature_names[loc_id]]))
+        return self.get_region(key)
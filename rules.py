@@ -1,15 +1,58 @@
-from typing import TYPE_CHECKING, Dict, Callable, Optional
+import itertools
+import math
+import weakref
+from typing import TYPE_CHECKING, Dict, Callable, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 
-from worlds.generic.Rules import set_rule, add_rule
-from .locations import location_table, LocationDict
+from worlds.generic.Rules import set_rule
+from .locations import location_table, get_location_flag_table, tool_flags, slip_flag_shift, LocationRecord, LocationFlag
 from .creatures import all_creatures, aggressive, suffix, hatchable, containment
-from .plants import all_flora
+from .plants import all_flora, plant_locations
+from .geometry import get_geometry_table, get_spatial_index
 from .options import AggressiveScanLogic, SubnauticaOptions
-import math
 
 if TYPE_CHECKING:
     from . import SubnauticaWorld
-    from BaseClasses import CollectionState, Location
+    from BaseClasses import CollectionState, Location, MultiWorld
+
+
+# Fixed item sets that rules check as a whole, each evaluated with a single has_all_counts call.
+vehicle_upgrade_console_parts: Dict[str, int] = {
+    "Vehicle Upgrade Console": 1,
+    "Moonpool Fragment": 2,
+}
+# Seamoth MK2/MK3 and Prawn MK2 depth modules: the upgrade console plus the modification station
+vehicle_depth_module_parts: Dict[str, int] = {
+    **vehicle_upgrade_console_parts,
+    "Modification Station Fragment": 3,
+}
+cyclops_depth_module_parts: Dict[str, int] = {
+    "Cyclops Depth Module MK1": 1,
+    "Modification Station Fragment": 3,
+}
+seamoth_parts: Dict[str, int] = {
+    "Seamoth Fragment": 3,
+    "Mobile Vehicle Bay Fragment": 3,
+}
+prawn_parts: Dict[str, int] = {
+    "Prawn Suit Fragment": 4,
+    "Mobile Vehicle Bay Fragment": 3,
+}
+cyclops_parts: Dict[str, int] = {
+    "Cyclops Bridge Fragment": 3,
+    "Cyclops Engine Fragment": 3,
+    "Cyclops Hull Fragment": 3,
+    "Mobile Vehicle Bay Fragment": 3,
+}
+neptune_launch_parts: Dict[str, int] = {
+    "Mobile Vehicle Bay Fragment": 3,
+    "Neptune Launch Platform": 1,
+    "Neptune Gantry": 1,
+    "Neptune Boosters": 1,
+    "Neptune Fuel Reserve": 1,
+    "Neptune Cockpit": 1,
+    "Ion Power Cell": 1,
+    "Ion Battery": 1,
+}
 
 
 def has_seaglide(state: "CollectionState", player: int) -> bool:
@@ -33,13 +76,13 @@ def has_moonpool(state: "CollectionState", player: int) -> bool:
 
 
 def has_vehicle_upgrade_console(state: "CollectionState", player: int) -> bool:
-    return state.has("Vehicle Upgrade Console", player) and has_moonpool(state, player)
+    return state.has_all_counts(vehicle_upgrade_console_parts, player)
 
 
 def has_seamoth(state: "CollectionState", player: int, options: SubnauticaOptions) -> bool:
     if options.include_seamoth.value > 0:
         return False
-    return state.has("Seamoth Fragment", player, 3) and has_mobile_vehicle_bay(state, player)
+    return state.has_all_counts(seamoth_parts, player)
 
 
 def has_seamoth_depth_module_mk1(state: "CollectionState", player: int) -> bool:
@@ -47,13 +90,11 @@ def has_seamoth_depth_module_mk1(state: "CollectionState", player: int) -> bool:
 
 
 def has_seamoth_depth_module_mk2(state: "CollectionState", player: int) -> bool:
-    return has_seamoth_depth_module_mk1(state, player) and \
-           has_modification_station(state, player)
+    return state.has_all_counts(vehicle_depth_module_parts, player)
 
 
 def has_seamoth_depth_module_mk3(state: "CollectionState", player: int) -> bool:
-    return has_seamoth_depth_module_mk2(state, player) and \
-           has_modification_station(state, player)
+    return state.has_all_counts(vehicle_depth_module_parts, player)
 
 
 def has_cyclops_bridge(state: "CollectionState", player: int) -> bool:
@@ -83,10 +124,7 @@ def has_thermal_plant(state: "CollectionState", player: int) -> bool:
 def has_cyclops(state: "CollectionState", player: int, options: SubnauticaOptions, shield_check: bool = False) -> bool:
     if options.include_cyclops.value > 0 and not shield_check:
         return False
-    return has_cyclops_bridge(state, player) and \
-           has_cyclops_engine(state, player) and \
-           has_cyclops_hull(state, player) and \
-           has_mobile_vehicle_bay(state, player)
+    return state.has_all_counts(cyclops_parts, player)
 
 
 def has_cyclops_depth_module_mk1(state: "CollectionState", player: int) -> bool:
@@ -95,19 +133,17 @@ def has_cyclops_depth_module_mk1(state: "CollectionState", player: int) -> bool:
 
 
 def has_cyclops_depth_module_mk2(state: "CollectionState", player: int) -> bool:
-    return has_cyclops_depth_module_mk1(state, player) and \
-           has_modification_station(state, player)
+    return state.has_all_counts(cyclops_depth_module_parts, player)
 
 
 def has_cyclops_depth_module_mk3(state: "CollectionState", player: int) -> bool:
-    return has_cyclops_depth_module_mk2(state, player) and \
-           has_modification_station(state, player)
+    return state.has_all_counts(cyclops_depth_module_parts, player)
 
 
 def has_prawn(state: "CollectionState", player: int, options: SubnauticaOptions) -> bool:
     if options.include_prawn.value > 0:
         return False
-    return state.has("Prawn Suit Fragment", player, 4) and has_mobile_vehicle_bay(state, player)
+    return state.has_all_counts(prawn_parts, player)
 
 
 def has_prawn_propulsion_arm(state: "CollectionState", player: int) -> bool:
@@ -120,8 +156,7 @@ def has_prawn_depth_module_mk1(state: "CollectionState", player: int) -> bool:
 
 
 def has_prawn_depth_module_mk2(state: "CollectionState", player: int) -> bool:
-    return has_prawn_depth_module_mk1(state, player) and \
-           has_modification_station(state, player)
+    return state.has_all_counts(vehicle_depth_module_parts, player)
 
 
 def has_laser_cutter(state: "CollectionState", player: int) -> bool:
@@ -150,8 +185,8 @@ def has_cyclops_shield(state: "CollectionState", player: int, options: Subnautic
         return has_cyclops(state, player, options, True) and \
             state.has("Cyclops Shield Generator", player)
 
-    return has_moonpool(state, player) and \
-        has_vehicle_upgrade_console(state, player) and \
+    # the upgrade console already needs the moonpool
+    return has_vehicle_upgrade_console(state, player) and \
         state.has("Cyclops Shield Generator", player)
 
 
@@ -167,15 +202,56 @@ def has_ultra_glide_fins(state: "CollectionState", player: int) -> bool:
     return has_modification_station(state, player) and state.has("Ultra Glide Fins", player)
 
 
-def get_max_swim_depth(state: "CollectionState", player: int, options: SubnauticaOptions, theoretical: bool = False) -> int:
-    depth: int = 600
+def has_seaglide_or_vehicle(state: "CollectionState", player: int, options: SubnauticaOptions) -> bool:
+    return has_seaglide(state, player) or \
+           has_seamoth(state, player, options) or \
+           has_cyclops(state, player, options)
+
+
+class LogicProfile(NamedTuple):
+    """The parts of the depth logic that only depend on a world's options.
+
+    SubnauticaWorld.generate_early works this out once, so the rules and create_items
+    don't each have to derive it from the options again."""
+    # swim depth without any items
+    swim_depth: int
+    # whether tanks, fins and the seaglide add to the swim depth
+    consider_items: bool
+    seaglide_depth: int
+    # whether swimming plus a fully upgraded seamoth reaches the deepest check
+    seamoth_can_make_it: bool
+    # whether the deepest check needs bases and power instead of vehicles
+    advanced_logic: bool
+
+
+def get_logic_profile(options: SubnauticaOptions) -> LogicProfile:
     if options.swim_rule.value > 999:
-        depth = int(options.swim_rule.value / 10)
+        swim_depth = int(options.swim_rule.value / 10)
+        consider_items = True
     else:
-        depth = options.swim_rule.value
-    additional_depth: int = get_additional_item_depth(state, player, options, theoretical)
+        swim_depth = options.swim_rule.value
+        consider_items = bool(options.consider_items.value)
+    seaglide_depth: int = options.seaglide_depth.value
+
+    theoretical_swim_depth = swim_depth
+    if consider_items:
+        theoretical_swim_depth += seaglide_depth + 150
 
-    return depth + additional_depth
+    # if include_seamoth is 1 or 2, it doesn't count anyway
+    # We have to be able to get to the last check between seamoth depth and swimming expertise
+    seamoth_can_make_it = options.include_seamoth.value == 0 and theoretical_swim_depth + 900 > 1443
+
+    # If we don't have a vehicle that can go to 1444m depth, then we have to use "hardcore" methods
+    # PreSeaglide Distance, laser cutter, and radiation will still gate some checks, so it's not completely open
+    advanced_logic = not seamoth_can_make_it \
+        and options.include_prawn.value > 0 \
+        and options.include_cyclops.value > 0
+
+    return LogicProfile(swim_depth, consider_items, seaglide_depth, seamoth_can_make_it, advanced_logic)
+
+
+def get_max_swim_depth(state: "CollectionState", player: int, profile: LogicProfile) -> int:
+    return profile.swim_depth + get_additional_item_depth(state, player, profile)
 
 
 # Swim depth rules:
@@ -184,16 +260,10 @@ def get_max_swim_depth(state: "CollectionState", player: int, options: Subnautic
 # Fins and ultra Fins are better than charge fins, so we ignore charge fins.
 
 # swim speeds: https://subnautica.fandom.com/wiki/Swimming_Speed
-def get_additional_item_depth(state: "CollectionState", player: int, options: SubnauticaOptions, theoretical: bool = False) -> int:
-    consider_items: bool = options.swim_rule.value > 999 or options.consider_items.value
-    seaglide_added_depth: int = options.seaglide_depth.value
-
-    if not consider_items:
+def get_additional_item_depth(state: "CollectionState", player: int, profile: LogicProfile) -> int:
+    if not profile.consider_items:
         return 0
 
-    if theoretical:
-        return seaglide_added_depth + 150
-
     plus_tank = 0
     negated_swim_penalty = 25
     if has_ultra_high_capacity_tank(state, player):
@@ -204,7 +274,7 @@ def get_additional_item_depth(state: "CollectionState", player: int, options: Su
         negated_swim_penalty = -25
 
     if has_seaglide(state, player):
-        return seaglide_added_depth + plus_tank + negated_swim_penalty
+        return profile.seaglide_depth + plus_tank + negated_swim_penalty
 
     # Can't use seaglide and fins at the same time
     if has_ultra_glide_fins(state, player):
@@ -277,108 +347,263 @@ def get_prawn_max_depth(state: "CollectionState", player, options: SubnauticaOpt
     return 900
 
 
-def get_max_depth(state: "CollectionState", player: int, options: SubnauticaOptions):
-    max_depth: int = get_max_swim_depth(state, player, options)
-
-    # if include_seamoth is 1 or 2, it doesn't count anyway
-    # We have to be able to get to the last check between seamoth depth and swimming expertise
-    seamoth_can_make_it: bool = False
-    if options.include_seamoth.value == 0 and get_max_swim_depth(state, player, options, "theoretical") + 900 > 1443:
-        seamoth_can_make_it = True
+class DepthState(NamedTuple):
+    """Everything get_max_depth works out for a state, kept per item signature by DepthCache."""
+    seaglide: bool
+    swim_depth: int
+    seamoth_depth: int
+    cyclops_depth: int
+    prawn_depth: int
+    hardcore_depth: int
+    max_depth: int
 
-    # If we don't have a vehicle that can go to 1444m depth, then we have to use "hardcore" methods
-    # PreSeaglide Distance, laser cutter, and radiation will still gate some checks, so it's not completely open
-    if seamoth_can_make_it is False \
-            and options.include_prawn.value > 0 \
-            and options.include_cyclops.value > 0:
-        return max_depth + get_hardcore_item_depth(state, player, max_depth)
 
-    return max_depth + max(
-        get_seamoth_max_depth(state, player, options),
-        get_cyclops_max_depth(state, player, options),
-        get_prawn_max_depth(state, player, options)
-    )
+def get_depth_state(state: "CollectionState", player: int, options: SubnauticaOptions,
+                    profile: LogicProfile) -> DepthState:
+    swim_depth: int = get_max_swim_depth(state, player, profile)
+    seamoth_depth = get_seamoth_max_depth(state, player, options)
+    cyclops_depth = get_cyclops_max_depth(state, player, options)
+    prawn_depth = get_prawn_max_depth(state, player, options)
+    hardcore_depth = get_hardcore_item_depth(state, player, swim_depth)
 
+    if profile.advanced_logic:
+        max_depth = swim_depth + hardcore_depth
+    else:
+        max_depth = swim_depth + max(seamoth_depth, cyclops_depth, prawn_depth)
 
-def is_radiated(x: float, y: float, z: float) -> bool:
-    aurora_dist = math.sqrt((x - 1038.0) ** 2 + y ** 2 + (z - -163.1) ** 2)
-    return aurora_dist < 950
+    return DepthState(has_seaglide(state, player), swim_depth, seamoth_depth, cyclops_depth, prawn_depth,
+                      hardcore_depth, max_depth)
 
 
-def can_access_location(state: "CollectionState", player: int, options: SubnauticaOptions, loc_id: int, loc: LocationDict) -> bool:
-    pos   = loc["position"]
-    pos_x = pos["x"]
-    pos_y = pos["y"]
-    pos_z = pos["z"]
+def get_max_depth(state: "CollectionState", player: int, options: SubnauticaOptions):
+    return get_depth_state(state, player, options, get_logic_profile(options)).max_depth
+
+
+# Every item count get_max_depth looks at, with the amount it checks for.
+# Keep this in sync with the has_* helpers above, otherwise DepthCache will serve stale depths.
+depth_requirements: Tuple[Tuple[str, int], ...] = (
+    ("Seaglide Fragment", 2),
+    ("Modification Station Fragment", 3),
+    ("Ultra High Capacity Tank", 1),
+    ("Lightweight High Capacity Tank", 1),
+    ("Ultra Glide Fins", 1),
+    ("Mobile Vehicle Bay Fragment", 3),
+    ("Vehicle Upgrade Console", 1),
+    ("Moonpool Fragment", 2),
+    ("Seamoth Fragment", 3),
+    ("Cyclops Bridge Fragment", 3),
+    ("Cyclops Engine Fragment", 3),
+    ("Cyclops Hull Fragment", 3),
+    ("Cyclops Depth Module MK1", 1),
+    ("Prawn Suit Fragment", 4),
+    ("Exterior Growbed", 1),
+    ("Nuclear Reactor Fragment", 3),
+    ("Bioreactor Fragment", 2),
+    ("Thermal Plant Fragment", 2),
+    ("Power Transmitter Fragment", 1),
+    ("Large Room", 1),
+    ("Multipurpose Room", 1),
+)
+
+
+depth_item_names: FrozenSet[str] = frozenset(name for name, count in depth_requirements)
+
+# Not an item: SubnauticaWorld.collect and remove keep the state's current max depth under this name.
+max_depth_key: str = "Subnautica Max Depth"
+
+
+class DepthCache:
+    """Per-world memo of get_depth_state.
+
+    The depth only changes when one of depth_requirements crosses its threshold, so the
+    result is keyed on which of those thresholds the state meets. Collecting or removing
+    items changes the key, which is all the invalidation needed.
+
+    On top of that, SubnauticaWorld.collect and remove call update whenever a depth item
+    changes, which stores the resulting max depth in the state itself; get then only
+    has to read it back.
+
+    The memo itself doesn't depend on the player, so it lives in SharedLogic and is
+    filled by every world with the same logic options."""
+    player: int
+    options: SubnauticaOptions
+    profile: LogicProfile
+    depths: Dict[Tuple[bool, ...], DepthState]
+
+    def __init__(self, player: int, options: SubnauticaOptions, shared_logic: "SharedLogic"):
+        self.player = player
+        self.options = options
+        self.profile = shared_logic.profile
+        self.depths = shared_logic.depths
+
+    def get_state(self, state: "CollectionState") -> DepthState:
+        counts = state.prog_items[self.player]
+        signature = tuple([counts[name] >= count for name, count in depth_requirements])
+        depth_state = self.depths.get(signature)
+        if depth_state is None:
+            depth_state = self.depths[signature] = get_depth_state(state, self.player, self.options, self.profile)
+        return depth_state
+
+    def get(self, state: "CollectionState") -> int:
+        depth = state.prog_items[self.player].get(max_depth_key)
+        if depth is None:
+            # no depth item was collected into this state yet
+            depth = self.get_state(state).max_depth
+        return depth
+
+    def update(self, state: "CollectionState") -> None:
+        state.prog_items[self.player][max_depth_key] = self.get_state(state).max_depth
+
+
+class LocationRequirement(NamedTuple):
+    """Everything a location_table entry needs, resolved against a world's options.
+
+    Most locations only differ by depth, so many of them end up with equal requirements."""
+    radiation_suit: bool
+    # LocationFlag tool bits that all have to be present
+    tools: int
+    # LocationFlag tool bits of which any one is enough, 0 if there is no such choice
+    any_tool: int
+    seaglide_or_vehicle: bool
+    depth: int
+
+
+laser_cutter_flag: int = LocationFlag.laser_cutter
+propulsion_cannon_flag: int = LocationFlag.propulsion_cannon
+
+
+def get_tools(state: "CollectionState", player: int) -> int:
+    tools = 0
+    if has_laser_cutter(state, player):
+        tools |= laser_cutter_flag
+    if has_propulsion_cannon(state, player):
+        tools |= propulsion_cannon_flag
+    return tools
+
+
+def get_location_requirement(options: SubnauticaOptions, loc_id: int) -> LocationRequirement:
+    geometry = get_geometry_table()[loc_id]
 
     # Check for radiation before we check the special locations below
-    if not options.ignore_radiation.value:
-        need_radiation_suit = is_radiated(pos_x, pos_y, pos_z)
-        if need_radiation_suit and not state.has("Radiation Suit", player):
-            return False
+    radiation_suit = geometry.radiated and not options.ignore_radiation.value
 
     # Set this above the special locations
-    player_can_slip_through = options.can_slip_through.value
+    player_can_slip_through = int(options.can_slip_through.get_tool_flags())
 
     # These two locations are special (Ring PDA and Lab PDA)
     if loc_id == 33107 or loc_id == 33108:
         # these can be reached by either side if the player is willing to "slip through"
-        if player_can_slip_through == 'propulsion_cannon':
-            return has_laser_cutter(state, player) or has_propulsion_cannon(state, player)
+        if player_can_slip_through & propulsion_cannon_flag:
+            return LocationRequirement(radiation_suit, 0, laser_cutter_flag | propulsion_cannon_flag, False, 0)
         else:
             # If they're not willing to slip through then they need the propulsion cannon either way
             # It doesn't really help to check for laser cutter here
-            return has_propulsion_cannon(state, player)
+            return LocationRequirement(radiation_suit, propulsion_cannon_flag, 0, False, 0)
 
     # Respect the "can slip through" flag in both variations
-    can_slip_through       = loc.get("can_slip_through", 'none')
-    need_laser_cutter      = loc.get("need_laser_cutter", False)
-    need_propulsion_cannon = loc.get("need_propulsion_cannon", False)
-
-    if need_laser_cutter and not has_laser_cutter(state, player):
-        if can_slip_through == 'laser':
-            if not (player_can_slip_through == 'laser_cutter' or player_can_slip_through == 'both'):
-                return False
-        else:
-            return False
+    flags = get_location_flag_table()[loc_id]
+    tools = flags & tool_flags & ~((flags >> slip_flag_shift) & player_can_slip_through)
 
-    if need_propulsion_cannon and not has_propulsion_cannon(state, player):
-        if can_slip_through == 'propulsion':
-            if not (player_can_slip_through == 'propulsion cannon' or player_can_slip_through == 'both'):
-                return False
-        else:
-            return False
-
-    depth = -pos_y  # y-up
+    depth = geometry.depth
 
     # Seaglide doesn't unlock anything specific, but just allows for faster movement.
     # Otherwise the game is painfully slow. Added: vehicles.
     # TODO: add prawn + grapple?
     # TODO: allow changing pre-seaglide depth? (maybe not? Is pretty important)
-    map_center_dist = math.sqrt(pos_x ** 2 + pos_z ** 2)
+    map_center_dist = geometry.center_distance
     pre_seaglide_distance: int = options.pre_seaglide_distance.value
-    if (map_center_dist > pre_seaglide_distance or depth > 200) and (
-            not has_seaglide(state, player) and \
-            not has_seamoth(state, player, options) and \
-            not has_cyclops(state, player, options)):
-        return False
-
-    return get_max_depth(state, player, options) >= depth
+    seaglide_or_vehicle = map_center_dist > pre_seaglide_distance or depth > 200
 
+    # max depth is always a whole number, so rounding up here doesn't change any outcome
+    return LocationRequirement(radiation_suit, int(tools), 0, seaglide_or_vehicle, math.ceil(depth))
 
-def set_location_rule(world: "SubnauticaWorld", player: int, options: SubnauticaOptions, id: int, loc: LocationDict):
-    set_rule(world.get_location(loc["name"]), lambda state: can_access_location(state, player, options, id, loc))
 
-
-def can_scan_creature(state: "CollectionState", player: int, options: SubnauticaOptions, creature: str) -> bool:
-    if not has_seaglide(state, player):
+def can_meet_requirement(state: "CollectionState", player: int, options: SubnauticaOptions,
+                         requirement: LocationRequirement, depth_cache: DepthCache) -> bool:
+    if requirement.radiation_suit and not state.has("Radiation Suit", player):
+        return False
+    if requirement.tools or requirement.any_tool:
+        tools = get_tools(state, player)
+        if requirement.tools & ~tools:
+            return False
+        if requirement.any_tool and not requirement.any_tool & tools:
+            return False
+    if requirement.seaglide_or_vehicle and not has_seaglide_or_vehicle(state, player, options):
         return False
-    return get_max_depth(state, player, options) >= all_creatures[creature]
+    return depth_cache.get(state) >= requirement.depth
+
+
+class LocationRuleCompiler:
+    """Hands out one shared rule per distinct LocationRequirement of a world,
+    and remembers which locations use it for get_reachable_location_ids."""
+    player: int
+    options: SubnauticaOptions
+    depth_cache: DepthCache
+    rules: Dict[LocationRequirement, Callable[["CollectionState"], bool]]
+    location_ids: Dict[LocationRequirement, List[int]]
+
+    def __init__(self, player: int, options: SubnauticaOptions, depth_cache: DepthCache):
+        self.player = player
+        self.options = options
+        self.depth_cache = depth_cache
+        self.rules = {}
+        self.location_ids = {}
+
+    def get_rule(self, requirement: LocationRequirement, loc_id: int) -> Callable[["CollectionState"], bool]:
+        self.location_ids.setdefault(requirement, []).append(loc_id)
+        rule = self.rules.get(requirement)
+        if rule is None:
+            player, options, depth_cache = self.player, self.options, self.depth_cache
+            rule = self.rules[requirement] = \
+                lambda state: can_meet_requirement(state, player, options, requirement, depth_cache)
+        return rule
+
+    def get_reachable_location_ids(self, state: "CollectionState") -> Set[int]:
+        """Evaluate every requirement against state at once; depth and tools are only looked up a single time."""
+        player = self.player
+        max_depth = self.depth_cache.get(state)
+        radiation_suit = state.has("Radiation Suit", player)
+        tools = get_tools(state, player)
+        seaglide_or_vehicle = has_seaglide_or_vehicle(state, player, self.options)
+
+        reachable: Set[int] = set()
+        for requirement, loc_ids in self.location_ids.items():
+            if max_depth < requirement.depth or \
+                    requirement.radiation_suit and not radiation_suit or \
+                    requirement.tools & ~tools or \
+                    requirement.any_tool and not requirement.any_tool & tools or \
+                    requirement.seaglide_or_vehicle and not seaglide_or_vehicle:
+                continue
+            reachable.update(loc_ids)
+        return reachable
+
+
+def set_location_rule(world: "SubnauticaWorld", compiler: LocationRuleCompiler, id: int, loc: LocationRecord):
+    requirement = world.shared_logic.requirements[id]
+    set_rule(world.get_location(loc.name), compiler.get_rule(requirement, id))
+
+
+def get_creature_requirement(option: AggressiveScanLogic, creature_name: str) -> \
+        Optional[Callable[["CollectionState", int], bool]]:
+    """Get the tool rule a creature scan needs on top of the seaglide and depth, if any."""
+    if creature_name in containment:  # there is no other way, hard-required containment
+        return has_containment
+    if creature_name in aggressive:
+        return get_aggression_rule(option, creature_name)
+    return None
 
 
 def set_creature_rule(world: "SubnauticaWorld", options: SubnauticaOptions, player: int, creature_name: str) -> "Location":
+    """Set a single rule combining everything a creature scan needs."""
     location = world.get_location(creature_name + suffix)
-    set_rule(location, lambda state: can_scan_creature(state, player, options, creature_name))
+    depth_cache = world.depth_cache
+    depth = all_creatures[creature_name]
+    tool_rule = get_creature_requirement(options.creature_scan_logic, creature_name)
+    if tool_rule is None:
+        set_rule(location, lambda state: has_seaglide(state, player) and depth_cache.get(state) >= depth)
+    else:
+        set_rule(location, lambda state: has_seaglide(state, player) and depth_cache.get(state) >= depth
+                 and tool_rule(state, player))
     return location
 
 
@@ -399,84 +624,133 @@ aggression_rules: Dict[int, Callable[["CollectionState", int], bool]] = {
 }
 
 
-def can_scan_plant(state: "CollectionState", player: int, options: SubnauticaOptions, plant: str) -> bool:
-    pos = {}
-    for p in all_flora.values():
-        if p["name"] + suffix == plant:
-            pos = p["position"]
+def get_plant_requirement(options: SubnauticaOptions, plant_id: int) -> LocationRequirement:
+    geometry = get_geometry_table()[plant_id]
+    radiation_suit = geometry.radiated and not options.ignore_radiation.value
+    seaglide_or_vehicle = geometry.center_distance > options.pre_seaglide_distance.value or geometry.depth > 200
+    return LocationRequirement(radiation_suit, 0, 0, seaglide_or_vehicle, math.ceil(geometry.depth))
 
-    pos_x = pos["x"]
-    pos_y = pos["y"]
-    pos_z = pos["z"]
 
-    if not options.ignore_radiation.value:
-        need_radiation_suit = is_radiated(pos_x, pos_y, pos_z)
-        if need_radiation_suit and not state.has("Radiation Suit", player):
-            return False
+# Every option the requirements, depths and LogicProfile are derived from.
+logic_option_names: Tuple[str, ...] = (
+    "swim_rule",
+    "consider_items",
+    "seaglide_depth",
+    "include_seamoth",
+    "include_prawn",
+    "include_cyclops",
+    "ignore_radiation",
+    "can_slip_through",
+    "pre_seaglide_distance",
+)
 
-    depth = -pos_y  # y-up
 
-    map_center_dist = math.sqrt(pos_x ** 2 + pos_z ** 2)
-    pre_seaglide_distance: int = options.pre_seaglide_distance.value
-    if (map_center_dist > pre_seaglide_distance or depth > 200) and \
-            not has_seaglide(state, player) and \
-            not has_seamoth(state, player, options) and \
-            not has_cyclops(state, player, options):
-        return False
+def get_logic_fingerprint(options: SubnauticaOptions) -> Tuple[int, ...]:
+    return tuple(getattr(options, name).value for name in logic_option_names)
+
+
+class SharedLogic:
+    """Rule data that only depends on the logic options, shared by all worlds of a multiworld that
+    have the same get_logic_fingerprint. Only the player differs between them, so they still get their
+    own rules, but resolve requirements and max depths only once."""
+    profile: LogicProfile
+    depths: Dict[Tuple[bool, ...], DepthState]
+    # LocationRequirement of every location_table and flora id
+    requirements: Dict[int, LocationRequirement]
+
+    def __init__(self, options: SubnauticaOptions):
+        self.profile = get_logic_profile(options)
+        self.depths = {}
+        self.requirements = {loc_id: get_location_requirement(options, loc_id) for loc_id in location_table}
+        self.requirements.update((plant_id, get_plant_requirement(options, plant_id)) for plant_id in all_flora)
+
 
-    return get_max_depth(state, player, options) >= depth
+shared_logic_by_multiworld: "weakref.WeakKeyDictionary[MultiWorld, Dict[Tuple[int, ...], SharedLogic]]" = \
+    weakref.WeakKeyDictionary()
 
 
-def set_plant_rule(world, player: int, options: SubnauticaOptions, plant_name: str):
+def get_shared_logic(multiworld: "MultiWorld", options: SubnauticaOptions) -> SharedLogic:
+    shared_logics = shared_logic_by_multiworld.setdefault(multiworld, {})
+    fingerprint = get_logic_fingerprint(options)
+    shared_logic = shared_logics.get(fingerprint)
+    if shared_logic is None:
+        shared_logic = shared_logics[fingerprint] = SharedLogic(options)
+    return shared_logic
+
+
+def set_plant_rule(world: "SubnauticaWorld", compiler: LocationRuleCompiler, plant_name: str):
     location = world.get_location(plant_name)
-    set_rule(location, lambda state: can_scan_plant(state, player, options, plant_name))
+    requirement = world.shared_logic.requirements[location.address]
+    set_rule(location, compiler.get_rule(requirement, location.address))
+
+
+def is_sphere_one(requirement: LocationRequirement, profile: LogicProfile) -> bool:
+    """Whether a location with this requirement is reachable without any items.
+    With no items the max depth is just the base swim depth."""
+    return not (requirement.radiation_suit or requirement.tools or requirement.any_tool
+                or requirement.seaglide_or_vehicle) and requirement.depth <= profile.swim_depth
+
+
+def get_sphere_one_location_ids(shared_logic: SharedLogic, options: SubnauticaOptions,
+                                plants_to_scan: List[str]) -> Set[int]:
+    """Ids of the world's locations reachable without any items, from the requirements alone."""
+    # Only locations shallow and close enough to get to without the seaglide can qualify;
+    # their requirements then rule out tools and radiation.
+    index = get_spatial_index()
+    profile = shared_logic.profile
+    candidates = set(index.query_depth_band(-math.inf, min(profile.swim_depth, 200)))
+    candidates.intersection_update(index.query_center_distance(-math.inf, options.pre_seaglide_distance.value))
+
+    # creature scans always need the seaglide, so they never count
+    chosen_plants = {plant_locations[plant] for plant in plants_to_scan}
+    return {loc_id for loc_id in candidates
+            if (loc_id in location_table or loc_id in chosen_plants)
+            and is_sphere_one(shared_logic.requirements[loc_id], profile)}
+
+
+def get_reachable_location_ids(subnautica_world: "SubnauticaWorld", state: "CollectionState") -> Set[int]:
+    """Ids of all the world's locations whose rules state meets, in one pass over the requirement groups.
+
+    Like the rules themselves, this doesn't check region access; with logic_regions every location
+    only sits behind entrances its own rule already implies."""
+    reachable = subnautica_world.rule_compiler.get_reachable_location_ids(state)
+    for creature_name in subnautica_world.creatures_to_scan:
+        location = subnautica_world.get_location(creature_name + suffix)
+        if location.access_rule(state):
+            reachable.add(location.address)
+    return reachable
 
 
 def set_rules(subnautica_world: "SubnauticaWorld"):
     player = subnautica_world.player
+    depth_cache = subnautica_world.depth_cache
 
+    compiler = subnautica_world.rule_compiler = LocationRuleCompiler(player, subnautica_world.options, depth_cache)
     for loc_id, loc in location_table.items():
-        set_location_rule(subnautica_world, player, subnautica_world.options, loc_id, loc)
+        set_location_rule(subnautica_world, compiler, loc_id, loc)
 
-    if subnautica_world.creatures_to_scan:
-        option = subnautica_world.options.creature_scan_logic
-
-        for creature_name in subnautica_world.creatures_to_scan:
-            location = set_creature_rule(subnautica_world, subnautica_world.options, player, creature_name)
-            if creature_name in containment:  # there is no other way, hard-required containment
-                add_rule(location, lambda state: has_containment(state, player))
-            elif creature_name in aggressive:
-                rule = get_aggression_rule(option, creature_name)
-                if rule:
-                    add_rule(location,
-                             lambda state, loc_rule=get_aggression_rule(option, creature_name): loc_rule(state, player))
+    for creature_name in subnautica_world.creatures_to_scan:
+        set_creature_rule(subnautica_world, subnautica_world.options, player, creature_name)
 
     if subnautica_world.plants_to_scan:
         for plant_name in subnautica_world.plants_to_scan:
-            set_plant_rule(subnautica_world, player, subnautica_world.options, plant_name)
+            set_plant_rule(subnautica_world, compiler, plant_name)
 
     # Victory locations
     if subnautica_world.options.goal.get_event_name() == "Neptune Launch":
         set_rule(subnautica_world.get_location("Neptune Launch"),
              lambda state:
-             get_max_depth(state, player, subnautica_world.options) >= 1444 and
-             has_mobile_vehicle_bay(state, player) and
-             state.has("Neptune Launch Platform", player) and
-             state.has("Neptune Gantry", player) and
-             state.has("Neptune Boosters", player) and
-             state.has("Neptune Fuel Reserve", player) and
-             state.has("Neptune Cockpit", player) and
-             state.has("Ion Power Cell", player) and
-             state.has("Ion Battery", player) and
+             depth_cache.get(state) >= 1444 and
+             state.has_all_counts(neptune_launch_parts, player) and
              has_cyclops_shield(state, player, subnautica_world.options))
 
     if subnautica_world.options.goal.get_event_name() == "Disable Quarantine":
         set_rule(subnautica_world.get_location("Disable Quarantine"),
-             lambda state: get_max_depth(state, player, subnautica_world.options) >= 1444)
+             lambda state: depth_cache.get(state) >= 1444)
 
     if subnautica_world.options.goal.get_event_name() == "Full Infection":
         set_rule(subnautica_world.get_location("Full Infection"),
-             lambda state: get_max_depth(state, player, subnautica_world.options) >= 900)
+             lambda state: depth_cache.get(state) >= 900)
 
     if subnautica_world.options.goal.get_event_name() == "Repair Aurora Drive":
         room = subnautica_world.get_location("Aurora Drive Room - Upgrade Console")
@@ -484,3 +758,9 @@ def set_rules(subnautica_world: "SubnauticaWorld"):
              lambda state: room.can_reach(state))
 
     subnautica_world.multiworld.completion_condition[player] = lambda state: state.has("Victory", player)
+
+    profiler = subnautica_world.rule_profiler
+    if profiler:
+        multiworld = subnautica_world.multiworld
+        for spot in itertools.chain(multiworld.get_locations(player), multiworld.get_entrances(player)):
+            spot.access_rule = profiler.wrap(spot.name, spot.access_rule)
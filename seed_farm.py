@@ -0,0 +1,162 @@
+"""Generates Subnautica seeds for every combination of an option grid in parallel, to find bad seeds ahead of time.
+
+Run from the Archipelago folder: python -m worlds.subnautica.seed_farm grid.yaml
+The grid is a YAML mapping of option names to lists of values, for example:
+    swim_rule: [easy, items_hard]
+    include_seamoth: [include, exclude]
+    creature_scan_logic: [either, stasis]
+    plant_scans: [0, 20]
+    goal: [launch, infected]
+Options left out keep their defaults. Every combination is written to a player YAML and generated with --seeds seeds
+through Archipelago's own Generate and Main, on a process pool using all cores. Wall time, fill failures and sphere
+counts of every seed are written to a CSV or JSON report, and every seed in it can be reproduced with
+python Generate.py --player_files_path <players folder of its case> --seed <seed>; --keep-players keeps those folders."""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+
+class SeedResult(NamedTuple):
+    case: int
+    seed: int
+    options: Dict[str, Any]
+    players_path: str
+    seconds: float
+    # "ok", "fill failed" or "error"
+    status: str
+    error: str
+    spheres: int
+    beatable: bool
+
+
+class SeedJob(NamedTuple):
+    case: int
+    seed: int
+    options: Dict[str, Any]
+    players_path: str
+
+
+def get_grid_cases(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    return [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+
+
+def write_players(folder: str, cases: List[Dict[str, Any]]) -> List[str]:
+    """Write a players folder with a single Subnautica YAML for every case. Returns the folders by case."""
+    players_paths: List[str] = []
+    for case, options in enumerate(cases):
+        players_path = os.path.join(folder, f"case_{case}")
+        os.makedirs(players_path)
+        with open(os.path.join(players_path, "Subnautica.yaml"), "w") as f:
+            yaml.safe_dump({"name": "Player", "game": "Subnautica", "Subnautica": options}, f)
+        players_paths.append(players_path)
+    return players_paths
+
+
+def generate_seed(job: SeedJob) -> SeedResult:
+    from Fill import FillError
+    import Generate
+    import Main
+
+    start = time.perf_counter()
+    spheres = 0
+    beatable = False
+    try:
+        with tempfile.TemporaryDirectory() as output_path:
+            # Generate reads its arguments from the command line, the same ones Generate.py takes,
+            # and every job runs in a worker process of its own.
+            sys.argv = [sys.argv[0], "--player_files_path", job.players_path, "--seed", str(job.seed),
+                        "--outputpath", output_path, "--skip_output"]
+            multiworld = Main.main(*Generate.main())
+            spheres = sum(1 for _ in multiworld.get_spheres())
+            beatable = multiworld.can_beat_game()
+    except FillError as exception:
+        return SeedResult(*job, time.perf_counter() - start, "fill failed", str(exception), 0, False)
+    except Exception:
+        return SeedResult(*job, time.perf_counter() - start, "error", traceback.format_exc(), 0, False)
+    return SeedResult(*job, time.perf_counter() - start, "ok", "", spheres, beatable)
+
+
+def get_jobs(cases: List[Dict[str, Any]], players_paths: List[str], seeds: int, base_seed: int) -> Iterator[SeedJob]:
+    for case, options in enumerate(cases):
+        for index in range(seeds):
+            yield SeedJob(case, base_seed + case * seeds + index, options, players_paths[case])
+
+
+def run_seed_farm(cases: List[Dict[str, Any]], players_paths: List[str], seeds: int, base_seed: int,
+                  workers: Optional[int]) -> List[SeedResult]:
+    workers = workers or os.cpu_count()
+    job_count = len(cases) * seeds
+    # a few jobs per round trip keeps all workers busy without pickling every result on its own
+    chunk_size = max(1, job_count // (workers * 4))
+    results: List[SeedResult] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        jobs = get_jobs(cases, players_paths, seeds, base_seed)
+        for result in executor.map(generate_seed, jobs, chunksize=chunk_size):
+            results.append(result)
+            if result.status != "ok":
+                print(f"case {result.case} seed {result.seed}: {result.status}")
+    return results
+
+
+def write_report(results: List[SeedResult], path: str) -> None:
+    rows = [result._asdict() for result in results]
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=4)
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SeedResult._fields)
+        writer.writeheader()
+        for row in rows:
+            row["options"] = json.dumps(row["options"])
+            writer.writerow(row)
+
+
+def print_summary(results: List[SeedResult], seconds: float) -> None:
+    failed = [result for result in results if result.status != "ok"]
+    unbeatable = [result for result in results if result.status == "ok" and not result.beatable]
+    print(f"{len(results)} seeds in {seconds:.1f}s, {len(failed)} failed, {len(unbeatable)} not beatable")
+    if results:
+        mean = sum(result.seconds for result in results) / len(results)
+        print(f"mean generation time {mean * 1000:.1f}ms, max {max(result.seconds for result in results) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("grid", help="YAML file mapping option names to lists of values")
+    parser.add_argument("--seeds", type=int, default=10, help="seeds per option combination")
+    parser.add_argument("--base-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the number of cores")
+    parser.add_argument("--report", default="subnautica_seeds.csv", help="report path, .csv or .json")
+    parser.add_argument("--keep-players", action="store_true",
+                        help="keep the players folder of every case, to reproduce seeds from the report")
+    cli_args = parser.parse_args()
+
+    with open(cli_args.grid) as grid_file:
+        option_grid: Dict[str, List[Any]] = yaml.safe_load(grid_file) or {}
+    grid_cases = get_grid_cases(option_grid)
+    players_folder = tempfile.mkdtemp(prefix="subnautica_seed_farm_")
+    try:
+        start_time = time.perf_counter()
+        seed_results = run_seed_farm(grid_cases, write_players(players_folder, grid_cases), cli_args.seeds,
+                                     cli_args.base_seed, cli_args.workers)
+        print_summary(seed_results, time.perf_counter() - start_time)
+        write_report(seed_results, cli_args.report)
+        print(f"report written to {cli_args.report}")
+    finally:
+        if cli_args.keep_players:
+            print(f"players folders kept in {players_folder}")
+        else:
+            shutil.rmtree(players_folder)
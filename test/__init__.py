@@ -1,5 +1,6 @@
 import unittest
 from worlds import subnautica
+from test.bases import WorldTestBase
 
 
 class SubnauticaTest(unittest.TestCase):
@@ -23,3 +24,7 @@ class SubnauticaTest(unittest.TestCase):
         for item_id in items.group_items:
             with self.subTest(item_id=item_id):
                 self.assertEqual(items.item_table[item_id].type, items.ItemType.group)
+
+
+class SubnauticaTestBase(WorldTestBase):
+    game = "Subnautica"
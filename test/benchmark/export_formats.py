@@ -0,0 +1,50 @@
+"""Benchmark of loading the JSON exports against the compact binary export.
+
+Run from the Archipelago folder after exporting both formats:
+    python worlds/subnautica/exports.py --binary
+    python -m worlds.subnautica.test.benchmark.export_formats
+Reports file size and the best load time out of a number of runs for each format."""
+
+import argparse
+import json
+import os
+import time
+from typing import Callable, Dict
+
+from ...binary_export import read_export
+
+json_files = ("locations.json", "logic.json", "items.json", "group_items.json", "item_types.json")
+binary_file = "subnautica.bin"
+
+
+def best_of(runs: int, function: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_export_benchmark(export_folder: str, runs: int) -> None:
+    json_data: Dict[str, bytes] = {}
+    for file_name in json_files:
+        with open(os.path.join(export_folder, file_name), "rb") as f:
+            json_data[file_name] = f.read()
+    with open(os.path.join(export_folder, binary_file), "rb") as f:
+        binary_data = f.read()
+
+    json_seconds = best_of(runs, lambda: [json.loads(data) for data in json_data.values()])
+    binary_seconds = best_of(runs, lambda: read_export(binary_data))
+    json_size = sum(len(data) for data in json_data.values())
+    print(f"{'format':<8} {'size (B)':>9} {'load (ms)':>10}")
+    print(f"{'json':<8} {json_size:>9} {json_seconds * 1000:>10.3f}")
+    print(f"{'binary':<8} {len(binary_data):>9} {binary_seconds * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--folder", default="Subnautica Export")
+    parser.add_argument("--runs", type=int, default=50)
+    cli_args = parser.parse_args()
+    run_export_benchmark(cli_args.folder, cli_args.runs)
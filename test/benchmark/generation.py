@@ -0,0 +1,157 @@
+"""Benchmark of the Subnautica world's generation steps over a matrix of options.
+
+Run from the Archipelago folder: python -m worlds.subnautica.test.benchmark.generation
+Reports wall time, rule calls and peak traced memory for every generation phase."""
+
+import argparse
+import itertools
+import time
+import tracemalloc
+from argparse import Namespace
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from BaseClasses import CollectionState, MultiWorld
+from Fill import distribute_items_restrictive
+from worlds.AutoWorld import call_all
+
+from ... import SubnauticaWorld
+from ...creatures import all_creatures
+from ...plants import all_flora
+
+phases: Tuple[str, ...] = (
+    "generate_early",
+    "create_regions",
+    "create_items",
+    "set_rules",
+    "connect_entrances",
+    "generate_basic",
+    "pre_fill",
+    "fill",
+)
+
+# Each axis is varied on its own against the defaults, unless the full product is requested.
+option_axes: Dict[str, List[Any]] = {
+    "swim_rule": ["easy", "normal", "hard", "items_easy", "items_normal", "items_hard"],
+    "include_seamoth": ["include", "exclude_logically", "exclude"],
+    "include_prawn": ["include", "exclude_logically", "exclude"],
+    "include_cyclops": ["include", "exclude_logically", "exclude"],
+    "creature_scans": [0, len(all_creatures)],
+    "plant_scans": [0, len(all_flora)],
+    "goal": ["launch", "free", "infected", "drive"],
+}
+
+
+class PhaseResult(NamedTuple):
+    seconds: float
+    rule_calls: int
+    peak_memory: int
+
+
+class RuleCounter:
+    """Wraps a player's location and entrance rules to count how often they are evaluated, and for how long."""
+    calls: int
+    seconds: float
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+
+    def wrap(self, rule: Callable[[CollectionState], bool]) -> Callable[[CollectionState], bool]:
+        perf_counter = time.perf_counter
+
+        def counted_rule(state: CollectionState) -> bool:
+            self.calls += 1
+            start = perf_counter()
+            result = rule(state)
+            self.seconds += perf_counter() - start
+            return result
+        return counted_rule
+
+    def install(self, multiworld: MultiWorld, player: int) -> None:
+        for spot in itertools.chain(multiworld.get_locations(player), multiworld.get_entrances(player)):
+            spot.access_rule = self.wrap(spot.access_rule)
+
+
+def get_option_matrix(full: bool) -> Iterator[Dict[str, Any]]:
+    if full:
+        for values in itertools.product(*option_axes.values()):
+            yield dict(zip(option_axes, values))
+        return
+    yield {}
+    for option_name, values in option_axes.items():
+        for value in values:
+            yield {option_name: value}
+
+
+def setup_multiworld(options: Dict[str, Any], seed: Optional[int], players: int = 1) -> MultiWorld:
+    """Local stand-in for Generate/Main: Subnautica slots that all use the given options."""
+    multiworld = MultiWorld(players)
+    multiworld.game = {player: SubnauticaWorld.game for player in multiworld.player_ids}
+    multiworld.player_name = {player: f"Tester{player}" for player in multiworld.player_ids}
+    multiworld.set_seed(seed)
+    args = Namespace()
+    for name, option in SubnauticaWorld.options_dataclass.type_hints.items():
+        value = options.get(name, option.default)
+        setattr(args, name, {player: option.from_any(value) for player in multiworld.player_ids})
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)
+    return multiworld
+
+
+def run_phase(multiworld: MultiWorld, phase: str) -> None:
+    if phase == "fill":
+        distribute_items_restrictive(multiworld)
+        call_all(multiworld, "post_fill")
+    else:
+        call_all(multiworld, phase)
+
+
+def benchmark_options(options: Dict[str, Any], seed: Optional[int]) -> Dict[str, PhaseResult]:
+    multiworld = setup_multiworld(options, seed)
+    counter = RuleCounter()
+    results: Dict[str, PhaseResult] = {}
+    tracemalloc.start()
+    try:
+        for phase in phases:
+            counter.calls = 0
+            tracemalloc.reset_peak()
+            start = time.perf_counter()
+            run_phase(multiworld, phase)
+            seconds = time.perf_counter() - start
+            results[phase] = PhaseResult(seconds, counter.calls, tracemalloc.get_traced_memory()[1])
+            if phase == "set_rules":
+                counter.install(multiworld, 1)
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def format_options(options: Dict[str, Any]) -> str:
+    return ", ".join(f"{name}={value}" for name, value in options.items()) or "defaults"
+
+
+def run_generation_benchmark(full: bool = False, seed: Optional[int] = None) -> None:
+    print(f"{'phase':<20} {'time (ms)':>10} {'rule calls':>11} {'peak (KiB)':>11}")
+    totals: Dict[str, float] = {phase: 0.0 for phase in phases}
+    for options in get_option_matrix(full):
+        print(format_options(options))
+        try:
+            results = benchmark_options(options, seed)
+        except Exception as exception:
+            print(f"  failed: {exception!r}")
+            continue
+        for phase, result in results.items():
+            totals[phase] += result.seconds
+            print(f"  {phase:<18} {result.seconds * 1000:>10.2f} {result.rule_calls:>11} "
+                  f"{result.peak_memory / 1024:>11.1f}")
+    print("total")
+    for phase, seconds in totals.items():
+        print(f"  {phase:<18} {seconds * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--full", action="store_true", help="benchmark the full product of all option axes")
+    parser.add_argument("--seed", type=int, default=None)
+    cli_args = parser.parse_args()
+    run_generation_benchmark(cli_args.full, cli_args.seed)
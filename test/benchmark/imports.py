@@ -0,0 +1,60 @@
+"""Import time budget of the Subnautica world.
+
+Run from the Archipelago folder: python -m worlds.subnautica.test.benchmark.imports
+Imports worlds.subnautica in fresh interpreters with -X importtime and reports the time spent in the world's
+own modules, excluding Archipelago and the standard library. Exits non-zero if the best run takes longer than
+the world did before the generation performance work, so launchers and WebHost that load every installed world
+don't pay for it. That time was measured on one machine; on a much faster or slower one, pass --budget with
+the 0.6.2 release's import time measured there."""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+package: str = "worlds.subnautica"
+# Self time of all Subnautica modules together, in milliseconds, of the world before the generation
+# performance work (release 0.6.2), best of several runs with compiled bytecode.
+baseline_import_time: float = 8.7
+
+
+def measure_import(module: str) -> Dict[str, float]:
+    """Self time in milliseconds of every module imported by a fresh interpreter importing module."""
+    # without bytecode caches every run would compile the sources again
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                             capture_output=True, text=True, check=True, env=env)
+    times: Dict[str, float] = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_time) / 1000
+    return times
+
+
+def get_world_times(times: Dict[str, float]) -> Dict[str, float]:
+    return {name: seconds for name, seconds in times.items() if name == package or name.startswith(package + ".")}
+
+
+def run_import_benchmark(runs: int, budget: float) -> bool:
+    # the first run also writes bytecode caches, so it is only a warm-up
+    measure_import(package)
+    results: List[Dict[str, float]] = [get_world_times(measure_import(package)) for _ in range(runs)]
+    best = min(results, key=lambda result: sum(result.values()))
+    for name, milliseconds in sorted(best.items(), key=lambda item: item[1], reverse=True):
+        print(f"{name:<40} {milliseconds:>8.2f} ms")
+    total = sum(best.values())
+    print(f"{'total':<40} {total:>8.2f} ms (budget {budget:.2f} ms)")
+    return total <= budget
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=baseline_import_time,
+                        help="milliseconds, defaults to the import time before the generation performance work")
+    cli_args = parser.parse_args()
+    sys.exit(0 if run_import_benchmark(cli_args.runs, cli_args.budget) else 1)
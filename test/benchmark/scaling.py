@@ -0,0 +1,112 @@
+"""Benchmark of how Subnautica generation cost grows with the number of Subnautica slots.
+
+Run from the Archipelago folder: python -m worlds.subnautica.test.benchmark.scaling
+Every slot uses the same options, so the cost per slot should stay flat as slots are added.
+Reports per slot time of the per player phases, the number of distinct rule closures set_rules
+leaves behind, time spent evaluating rules during fill and peak traced memory."""
+
+import argparse
+import itertools
+import time
+import tracemalloc
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from BaseClasses import MultiWorld
+
+from .generation import RuleCounter, run_phase, setup_multiworld
+
+player_counts: Tuple[int, ...] = (1, 10, 50, 100)
+
+# Phases that do the same work once for every slot; their time per slot is what should stay flat.
+slot_phases: Tuple[str, ...] = (
+    "generate_early",
+    "create_regions",
+    "create_items",
+    "set_rules",
+)
+
+remaining_phases: Tuple[str, ...] = (
+    "connect_entrances",
+    "generate_basic",
+    "pre_fill",
+    "fill",
+)
+
+
+class ScalingResult(NamedTuple):
+    players: int
+    phase_seconds: Dict[str, float]
+    rule_closures: int
+    rule_calls: int
+    rule_seconds: float
+    peak_memory: int
+
+    @property
+    def slot_seconds(self) -> float:
+        return sum(self.phase_seconds[phase] for phase in slot_phases) / self.players
+
+
+def count_rule_closures(multiworld: MultiWorld) -> int:
+    """Distinct rule callables over all locations and entrances; shared rules are counted once."""
+    rules = {id(spot.access_rule)
+             for spot in itertools.chain(multiworld.get_locations(), multiworld.get_entrances())}
+    return len(rules)
+
+
+def benchmark_players(players: int, options: Dict[str, Any], seed: Optional[int], fill: bool) -> ScalingResult:
+    multiworld = setup_multiworld(options, seed, players)
+    counter = RuleCounter()
+    phase_seconds: Dict[str, float] = {}
+    rule_closures = 0
+    tracemalloc.start()
+    try:
+        for phase in slot_phases + (remaining_phases if fill else ()):
+            start = time.perf_counter()
+            run_phase(multiworld, phase)
+            phase_seconds[phase] = time.perf_counter() - start
+            if phase == "set_rules":
+                rule_closures = count_rule_closures(multiworld)
+                for player in multiworld.player_ids:
+                    counter.install(multiworld, player)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return ScalingResult(players, phase_seconds, rule_closures, counter.calls, counter.seconds, peak_memory)
+
+
+def run_scaling_benchmark(counts: List[int], options: Dict[str, Any], seed: Optional[int], fill: bool) -> None:
+    header = " ".join(f"{phase:>15}" for phase in slot_phases)
+    print(f"{'players':>7} {header} {'slot (ms)':>10} {'vs first':>9} {'rules/slot':>10} "
+          f"{'rule calls':>11} {'rule (ms)':>10} {'peak/slot (KiB)':>15}")
+    results: List[ScalingResult] = []
+    for players in counts:
+        try:
+            result = benchmark_players(players, options, seed, fill)
+        except Exception as exception:
+            print(f"{players:>7} failed: {exception!r}")
+            continue
+        results.append(result)
+        phases = " ".join(f"{result.phase_seconds[phase] * 1000 / players:>15.3f}" for phase in slot_phases)
+        print(f"{players:>7} {phases} {result.slot_seconds * 1000:>10.3f} "
+              f"{result.slot_seconds / results[0].slot_seconds:>8.2f}x "
+              f"{result.rule_closures / players:>10.1f} {result.rule_calls:>11} {result.rule_seconds * 1000:>10.2f} "
+              f"{result.peak_memory / 1024 / players:>15.1f}")
+
+    if results:
+        # crude chart of the per slot cost, so growth stands out at a glance
+        print()
+        widest = max(result.slot_seconds for result in results)
+        for result in results:
+            bar = "#" * max(1, round(result.slot_seconds / widest * 60))
+            print(f"{result.players:>7} {bar}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, nargs="+", default=list(player_counts),
+                        help="slot counts to benchmark")
+    parser.add_argument("--no-fill", dest="fill", action="store_false",
+                        help="only run the per slot phases, skipping fill and with it rule evaluation")
+    parser.add_argument("--seed", type=int, default=None)
+    cli_args = parser.parse_args()
+    run_scaling_benchmark(cli_args.players, {}, cli_args.seed, cli_args.fill)
@@ -0,0 +1,49 @@
+import json
+import os
+import tempfile
+import unittest
+
+from ..binary_export import read_export, write_export
+from ..exports import binary_name, manifest_name, write_exports
+from ..items import group_items, item_table, items_by_type
+from ..locations import LocationFlag, get_location_flag_table, location_table
+
+
+class TestBinaryExport(unittest.TestCase):
+    def test_round_trip(self):
+        locations = {location_id: (data.x, data.y, data.z) for location_id, data in location_table.items()}
+        flags = get_location_flag_table()
+        laser_cutter = [location_id for location_id, location_flags in flags.items()
+                        if location_flags & LocationFlag.laser_cutter]
+        propulsion_cannon = [location_id for location_id, location_flags in flags.items()
+                             if location_flags & LocationFlag.propulsion_cannon]
+        items = {item_id: item_data.tech_type for item_id, item_data in item_table.items()}
+
+        export = read_export(b"".join(write_export(locations, laser_cutter, propulsion_cannon, items,
+                                                   group_items, items_by_type)))
+
+        self.assertEqual(list(export.locations), list(locations))
+        for location_id, position in locations.items():
+            for exported, expected in zip(export.locations[location_id], position):
+                self.assertAlmostEqual(exported, expected, places=3)
+        self.assertEqual(export.laser_cutter, laser_cutter)
+        self.assertEqual(export.propulsion_cannon, propulsion_cannon)
+        self.assertEqual(export.items, items)
+        self.assertEqual({key: set(ids) for key, ids in export.groups.items()}, group_items)
+        self.assertEqual(export.item_types, {int(key): ids for key, ids in items_by_type.items()})
+
+
+class TestExports(unittest.TestCase):
+    def test_plain_export_removes_binary(self):
+        with tempfile.TemporaryDirectory() as export_folder:
+            written, removed = write_exports(export_folder, "1.0.0", binary=True)
+            self.assertIn(binary_name, written)
+            self.assertEqual(removed, [])
+
+            written, removed = write_exports(export_folder, "1.0.0", binary=False)
+            self.assertEqual(written, [manifest_name])
+            self.assertEqual(removed, [binary_name])
+            with open(os.path.join(export_folder, manifest_name)) as f:
+                listed = set(json.load(f)["files"])
+            self.assertEqual(set(os.listdir(export_folder)) - {manifest_name}, listed)
+            self.assertNotIn(binary_name, listed)
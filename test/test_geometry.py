@@ -0,0 +1,33 @@
+import math
+import unittest
+
+from ..geometry import aurora_center, get_geometry_table, get_spatial_index, is_radiated, radiation_radius
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = get_spatial_index()
+        self.positions = self.index.positions
+
+    def test_radius(self):
+        self.assertEqual(sorted(self.index.query_radius(*aurora_center, radiation_radius)),
+                         sorted(loc_id for loc_id, position in self.positions.items() if is_radiated(*position)))
+        for x, y, z, radius in ((0, 0, 0, 300), (-600, -500, 1400, 250), (300, -100, -300, 0)):
+            with self.subTest(center=(x, y, z), radius=radius):
+                expected = [loc_id for loc_id, position in self.positions.items()
+                            if math.dist(position, (x, y, z)) < radius]
+                self.assertEqual(sorted(self.index.query_radius(x, y, z, radius)), sorted(expected))
+
+    def test_ring(self):
+        for x, z, inner, outer in ((0, 0, 800, math.inf), (0, 0, -math.inf, 600), (-500, 700, 100, 400)):
+            with self.subTest(center=(x, z), inner=inner, outer=outer):
+                expected = [loc_id for loc_id, (loc_x, loc_y, loc_z) in self.positions.items()
+                            if inner < math.dist((loc_x, loc_z), (x, z)) <= outer]
+                self.assertEqual(sorted(self.index.query_ring(x, z, inner, outer)), sorted(expected))
+
+    def test_depth_band(self):
+        geometry = get_geometry_table()
+        for low, high in ((-math.inf, 200), (200, 500), (900, math.inf)):
+            with self.subTest(low=low, high=high):
+                expected = [loc_id for loc_id, loc_geometry in geometry.items() if low < loc_geometry.depth <= high]
+                self.assertEqual(sorted(self.index.query_depth_band(low, high)), sorted(expected))
@@ -0,0 +1,20 @@
+from . import SubnauticaTestBase
+
+
+class TestBulkFiller(SubnauticaTestBase):
+    options = {
+        "filler_items_distribution": {"Titanium": 3, "Copper Ore": 1, "Lithium": 2},
+    }
+
+    def test_bulk_matches_single_draws(self):
+        state = self.world.random.getstate()
+        single = [self.world.get_filler_item_name() for _ in range(50)]
+        self.world.random.setstate(state)
+        self.assertEqual(single, self.world.get_filler_item_names(50))
+
+    def test_bulk_items(self):
+        items = self.world.create_filler_items(20)
+        self.assertEqual(len(items), 20)
+        for item in items:
+            self.assertIn(item.name, {"Titanium", "Copper Ore", "Lithium"})
+            self.assertEqual(item.player, self.player)
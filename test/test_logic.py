@@ -0,0 +1,146 @@
+import dataclasses
+
+from BaseClasses import CollectionState
+from . import SubnauticaTestBase
+from ..options import SwimRule
+from ..rules import get_max_depth, get_reachable_location_ids, get_shared_logic, get_sphere_one_location_ids
+
+
+class TestDepthCache(SubnauticaTestBase):
+    def test_depth_follows_state(self):
+        cache = self.world.depth_cache
+        state = self.multiworld.state
+        base_depth = cache.get(state)
+        self.assertEqual(base_depth, get_max_depth(state, self.player, self.world.options))
+
+        seamoth = self.collect_by_name(["Seamoth Fragment", "Mobile Vehicle Bay Fragment"])
+        self.assertEqual(cache.get(state), get_max_depth(state, self.player, self.world.options))
+        self.assertGreater(cache.get(state), base_depth)
+        self.assertEqual(cache.get(state.copy()), cache.get(state))
+
+        self.remove(seamoth)
+        self.assertEqual(cache.get(state), base_depth)
+
+
+class TestItemLinks(SubnauticaTestBase):
+    def test_collect_through_group(self):
+        group_id, _ = self.multiworld.add_group("Subnautica Link", self.game, frozenset({self.player}))
+        state = CollectionState(self.multiworld)
+        item = self.multiworld.worlds[group_id].create_item("Seaglide Fragment")
+        self.assertTrue(state.collect(item))
+        self.assertTrue(state.remove(item))
+
+
+class TestSharedLogic(SubnauticaTestBase):
+    def test_shared_by_fingerprint(self):
+        options = self.world.options
+        same_logic = dataclasses.replace(options, death_link=options.death_link.from_any(True))
+        self.assertIs(get_shared_logic(self.multiworld, same_logic), self.world.shared_logic)
+        self.assertIs(self.world.depth_cache.depths, self.world.shared_logic.depths)
+
+        other_logic = dataclasses.replace(options, swim_rule=SwimRule.from_any("items_hard"))
+        self.assertIsNot(get_shared_logic(self.multiworld, other_logic), self.world.shared_logic)
+
+
+class TestSphereOne(SubnauticaTestBase):
+    options = {
+        "plant_scans": 20,
+    }
+
+    def get_rule_count(self) -> int:
+        state = CollectionState(self.multiworld)
+        return sum(1 for location in self.multiworld.get_locations(self.player)
+                   if location.address is not None and location.item is None and location.access_rule(state))
+
+    def test_ids_match_rules(self):
+        state = CollectionState(self.multiworld)
+        reachable = {location.address for location in self.multiworld.get_locations(self.player)
+                     if location.address is not None and location.access_rule(state)}
+        self.assertEqual(reachable, get_sphere_one_location_ids(self.world.shared_logic, self.world.options,
+                                                                self.world.plants_to_scan))
+
+    def test_starting_items_count(self):
+        without_items = self.world.count_sphere_one()
+        self.assertEqual(without_items, self.get_rule_count())
+        for _ in range(2):
+            self.multiworld.push_precollected(self.world.create_item("Seaglide Fragment"))
+        self.assertGreater(self.world.count_sphere_one(), without_items)
+        self.assertEqual(self.world.count_sphere_one(), self.get_rule_count())
+
+    def test_early_seaglide_does_not_fit(self):
+        self.multiworld.local_early_items[self.player]["Titanium"] = self.world.count_sphere_one()
+        with self.assertLogs(level="WARNING") as logs:
+            self.world.check_sphere_one()
+        self.assertIn("Early Seaglide", logs.output[0])
+
+
+class TestSphereOneWithoutEarlySeaglide(SubnauticaTestBase):
+    options = {
+        "early_seaglide": False,
+    }
+
+    def test_early_items_do_not_fit(self):
+        self.world.check_sphere_one()
+        self.multiworld.local_early_items[self.player]["Titanium"] = self.world.count_sphere_one() + 1
+        with self.assertLogs(level="WARNING"):
+            self.world.check_sphere_one()
+
+
+class TestLogicRegions(SubnauticaTestBase):
+    options = {
+        "logic_regions": True,
+        "creature_scans": 20,
+        "plant_scans": 20,
+    }
+
+    def test_regions_match_location_rules(self):
+        locations = self.multiworld.get_locations(self.player)
+        for item in self.multiworld.itempool:
+            if item.player != self.player or not item.advancement:
+                continue
+            self.collect(item)
+            for location in locations:
+                with self.subTest(location=location.name, item=item.name):
+                    self.assertEqual(location.access_rule(self.multiworld.state),
+                                     location.can_reach(self.multiworld.state))
+
+
+class TestBatchReachability(SubnauticaTestBase):
+    options = {
+        "creature_scans": 20,
+        "plant_scans": 20,
+    }
+
+    def test_batch_matches_location_rules(self):
+        locations = [location for location in self.multiworld.get_locations(self.player)
+                     if location.address is not None]
+        for item in self.multiworld.itempool:
+            if item.player != self.player or not item.advancement:
+                continue
+            self.collect(item)
+            expected = {location.address for location in locations if location.access_rule(self.multiworld.state)}
+            self.assertEqual(expected, get_reachable_location_ids(self.world, self.multiworld.state))
+
+
+class TestNoSlipThrough(SubnauticaTestBase):
+    def test_laser_cutter_needed(self):
+        self.collect_by_name(["Radiation Suit"])
+        self.assertFalse(self.can_reach_location("Grassy Plateaus East Wreck - Breach Databox"))
+        self.collect_by_name(["Laser Cutter Fragment"])
+        self.assertTrue(self.can_reach_location("Grassy Plateaus East Wreck - Breach Databox"))
+
+
+class TestSlipThrough(SubnauticaTestBase):
+    options = {
+        "can_slip_through": "both",
+    }
+
+    def test_laser_cutter_slipped_through(self):
+        self.collect_by_name(["Radiation Suit"])
+        self.assertTrue(self.can_reach_location("Grassy Plateaus East Wreck - Breach Databox"))
+
+    def test_ring_reachable_by_either_tool(self):
+        self.collect_by_name(["Radiation Suit"])
+        self.assertFalse(self.can_reach_location("Aurora - Ring PDA"))
+        self.collect_by_name(["Laser Cutter Fragment"])
+        self.assertTrue(self.can_reach_location("Aurora - Ring PDA"))